@@ -19,6 +19,7 @@ import subprocess
 from common import *
 
 import siliconcompiler
+from siliconcompiler.schema import _encode_cfg
 
 # We need this in a few places, so just make it global
 SC_ROOT = os.path.abspath(f'{__file__}/../../../')
@@ -26,7 +27,7 @@ SC_ROOT = os.path.abspath(f'{__file__}/../../../')
 def build_schema_value_table(schema, keypath_prefix=[], skip_zero_weight=False):
     '''Helper function for displaying values set in schema as a docutils table.'''
     table = [[strong('Keypath'), strong('Value')]]
-    flat_cfg = flatten(schema)
+    flat_cfg = flatten(_encode_cfg(schema))
     for keys, val in flat_cfg.items():
         full_keypath = list(keypath_prefix) + list(keys)
 
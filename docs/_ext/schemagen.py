@@ -2,7 +2,7 @@ from docutils import nodes
 from sphinx.util.nodes import nested_parse_with_titles
 from docutils.statemachine import ViewList
 from sphinx.util.docutils import SphinxDirective
-from siliconcompiler.schema import schema_cfg
+from siliconcompiler.schema import schema_cfg, _encode_value
 
 from common import *
 
@@ -36,7 +36,7 @@ class SchemaGen(SphinxDirective):
         if 'help' in schema:
             entries = [[strong('Description'),   para(schema['shorthelp'])],
                        [strong('Type'),          para(schema['type'])],
-                       [strong('Default Value'), para(schema['defvalue'])],
+                       [strong('Default Value'), para(_encode_value(schema['defvalue']))],
                        [strong('CLI Switch'),    code(schema['switch'])]]
             for example in schema['example']:
                 name, ex = example.split(':', 1)
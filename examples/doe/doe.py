@@ -50,9 +50,10 @@ def main():
     # Post-processing data
     print("-"*80)
     chip = siliconcompiler.Chip()
+    chip.set('design', design)
     for i in range(len(N)):
         jobname = 'job'+str(i)
-        chip.read_manifest(f"build/{design}/{jobname}/syn/0/outputs/{design}.pkg.json", job=jobname)
+        chip.read_manifest(chip.find_manifest(step='syn', jobname=jobname), job=jobname)
         area = chip.get('metric','syn','0','cellarea','real', job=jobname)
         print(design, ", N =", N[i], ", cellarea =",area) 
 
@@ -41,16 +41,10 @@ def main():
     elif def_mode:
         filename = chip.get('read', 'def', 'show', '0')[-1]
     else:
-        design = chip.get('design')
-        dirlist =[chip.cwd,
-                  'build',
-                  chip.get('design'),
-                  'job0',
-                  'import',
-                  '0',
-                  'outputs',
-                  design + '.pkg.json']
-        manifest = os.path.join(*dirlist)
+        manifest = chip.find_manifest(step='import')
+        if manifest is None:
+            chip.logger.error('No import manifest found for design')
+            sys.exit(1)
         chip.read_manifest(manifest)
         filename = chip.find_result('gds', step='export')
         if filename is None:
@@ -61,7 +55,10 @@ def main():
         # only autoload manifest if user doesn't supply manually
         design = os.path.splitext(os.path.basename(filename))[0]
         dirname = os.path.dirname(filename)
-        manifest = os.path.join(*[dirname, design+'.pkg.json'])
+        # task manifests are written in msgpack form when it is installed
+        manifest = os.path.join(*[dirname, design+'.pkg.msgpack'])
+        if not os.path.isfile(manifest):
+            manifest = os.path.join(*[dirname, design+'.pkg.json'])
         if not os.path.isfile(manifest):
             chip.logger.error(f'Unable to automatically find manifest for design {design}. '
                 'Please provide a manifest explicitly using -cfg.')
@@ -3,7 +3,6 @@
 import base64
 import glob
 import math
-import multiprocessing
 import importlib
 import json
 import os
@@ -17,6 +16,7 @@ import uuid
 
 from siliconcompiler.crypto import *
 from siliconcompiler import utils
+from siliconcompiler.schema import _encode_cfg
 
 ###################################
 def get_base_url(chip):
@@ -46,9 +46,9 @@ def remote_preprocess(chip):
         job_hash = uuid.uuid4().hex
         chip.status['jobhash'] = job_hash
 
-    manager = multiprocessing.Manager()
-    error = manager.dict()
-    active = manager.dict()
+    # the import step runs in this process, plain dicts hold its status
+    error = {}
+    active = {}
 
     # Setup up tools for all local functions
     remote_steplist = chip.getkeys('flowgraph')
@@ -123,7 +123,7 @@ def request_remote_run(chip):
     # Use authentication if necessary.
     job_nameid = f"{chip.get('jobname')}"
     post_params = {
-        'chip_cfg': chip.cfg,
+        'chip_cfg': _encode_cfg(chip.cfg),
         'params': {
             'job_hash': chip.status['jobhash'],
         }
@@ -5,9 +5,13 @@ import base64
 import time
 import datetime
 import multiprocessing
+import multiprocessing.connection
 import tarfile
+import tempfile
+import glob
 import traceback
 import asyncio
+import concurrent.futures
 from subprocess import run, PIPE
 import os
 import pathlib
@@ -23,7 +27,6 @@ import importlib
 import textwrap
 import math
 import pandas
-import yaml
 import graphviz
 import time
 import uuid
@@ -36,8 +39,14 @@ from pathlib import Path
 from timeit import default_timer as timer
 from siliconcompiler.client import *
 from siliconcompiler.schema import *
+from siliconcompiler.schema import _typedesc, _copy_cfg, _encode_cfg, _decode_cfg
+from siliconcompiler.schema import _delta_cfg, _overlay_cfg, _ManifestView, _plain_cfg
+from siliconcompiler.schema import _reduce_cfg, _empty_value, _digest_cfg
+from siliconcompiler.schema import _encode_value
+from siliconcompiler.schema import _schema_template, _own_cfg, _Parameter
 from siliconcompiler.scheduler import _deferstep
 from siliconcompiler import utils
+from siliconcompiler.utils import YamlIndentDumper
 
 from siliconcompiler import _metadata
 
@@ -62,8 +71,32 @@ class Chip:
         self.scroot = os.path.dirname(os.path.abspath(__file__))
         self.cwd = os.getcwd()
         self.error = 0
-        self.cfg = schema_cfg()
+        self.cfg = _own_cfg(_schema_template())
         self.cfghistory = {}
+        # Flat keypath -> leaf index for self.cfg, see _leafindex()
+        self._index = {}
+        self._indexcfg = None
+        # Memoized keypaths of self.cfg, see _keypaths()
+        self._keylist = None
+        # Keypaths of self.cfg grouped by field value, see _paramindex()
+        self._fields = None
+        # Base manifest file and configuration for delta manifests, set by
+        # run(), see _write_delta()
+        self._deltabase = None
+        self._deltacfg = None
+        # Manifest files written by write_manifest(), by absolute path
+        self._written = {}
+        # Fingerprints of the tasks started by _run_tasks(), recorded by
+        # _runtask() when they succeed, and memoized file hashes
+        self._fingerprints = {}
+        self._filehashes = {}
+        # Configurations task fingerprints are taken from, and the one
+        # run() last read back from a task, see _fingerprint_task()
+        self._fingerprintcfg = None
+        self._resultcfg = None
+        # Tasks of the last run() that _run_tasks() found done without
+        # running them
+        self._reused = set()
         # The 'status' dictionary can be used to store ephemeral config values.
         # Its contents will not be saved, and can be set by parent scripts
         # such as a web server or supervisor process. Currently supported keys:
@@ -84,11 +117,15 @@ class Chip:
 
         # We set 'design' and 'loglevel' directly in the config dictionary
         # because of a chicken-and-egg problem: self.set() relies on the logger,
-        # but the logger relies on these values.
-        self.cfg['design']['value'] = design
-        self.cfg['loglevel']['value'] = loglevel
-        # We set scversion directly because it has its 'lock' flag set by default.
-        self.cfg['version']['sc']['value'] = _metadata.version
+        # but the logger relies on these values. We set scversion directly
+        # because it has its 'lock' flag set by default. Leaf cells are shared
+        # with the schema template, so they are replaced rather than modified.
+        for keypath, value in ((('design',), design),
+                               (('loglevel',), loglevel),
+                               (('version', 'sc'), _metadata.version)):
+            branch, key = self._lookup(self.cfg, keypath, create=True)
+            branch[key] = branch[key].copy()
+            branch[key]['value'] = value
 
         self._init_logger()
 
@@ -712,7 +749,7 @@ class Chip:
             default = None
 
         if valid_keypaths is None:
-            valid_keypaths = self.getkeys()
+            valid_keypaths = self._keypaths()
 
         # Look for a full match with default playing wild card
         for valid_keypath in valid_keypaths:
@@ -767,10 +804,9 @@ class Chip:
             else:
                 cfg = self.cfg
 
-        keypathstr = ','.join(keypath)
-
-        self.logger.debug(f"Reading from [{keypathstr}]. Field = '{field}'")
-        return self._search(cfg, keypathstr, *keypath, field=field, mode='get')
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Reading from [%s]. Field = '%s'", ','.join(keypath), field)
+        return self._search(cfg, *keypath, field=field, mode='get')
 
     ###########################################################################
     def getkeys(self, *keypath, cfg=None):
@@ -800,14 +836,17 @@ class Chip:
             cfg = self.cfg
 
         if len(list(keypath)) > 0:
-            keypathstr = ','.join(keypath)
-            self.logger.debug('Getting schema parameter keys for: %s', keypathstr)
-            keys = list(self._search(cfg, keypathstr, *keypath, mode='getkeys'))
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug('Getting schema parameter keys for: %s', ','.join(keypath))
+            keys = list(self._search(cfg, *keypath, mode='getkeys'))
             if 'default' in keys:
                 keys.remove('default')
         else:
             self.logger.debug('Getting all schema parameter keys.')
-            keys = list(self._allkeys(cfg))
+            if cfg is self.cfg:
+                keys = [list(keypath) for keypath in self._keypaths()]
+            else:
+                keys = list(self._allkeys(cfg))
 
         return keys
 
@@ -836,11 +875,11 @@ class Chip:
             cfg = self.cfg
 
         if len(list(keypath)) > 0:
-            keypathstr = ','.join(keypath)
-            self.logger.debug('Getting cfg for: %s', keypathstr)
-            localcfg = self._search(cfg, keypathstr, *keypath, mode='getcfg')
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug('Getting cfg for: %s', ','.join(keypath))
+            localcfg = self._search(cfg, *keypath, mode='getcfg')
 
-        return copy.deepcopy(localcfg)
+        return _plain_cfg(localcfg)
 
     ###########################################################################
     def set(self, *args, field='value', clobber=True, cfg=None):
@@ -877,15 +916,13 @@ class Chip:
             if not isinstance(key,str):
                 self.logger.error(f"Key [{key}] is not a string [{args}]")
 
-        keypathstr = ','.join(args[:-1])
-        all_args = list(args)
-
         # Special case to ensure loglevel is updated ASAP
         if len(args) == 2 and args[0] == 'loglevel' and field == 'value':
             self.logger.setLevel(args[1])
 
-        self.logger.debug(f"Setting [{keypathstr}] to {args[-1]}")
-        return self._search(cfg, keypathstr, *all_args, field=field, mode='set', clobber=clobber)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Setting [%s] to %s", ','.join(args[:-1]), args[-1])
+        return self._search(cfg, *args, field=field, mode='set', clobber=clobber)
 
     ###########################################################################
     def add(self, *args, cfg=None, field='value'):
@@ -920,11 +957,107 @@ class Chip:
             if not isinstance(key,str):
                 self.logger.error(f"Key [{key}] is not a string [{args}]")
 
-        keypathstr = ','.join(args[:-1])
-        all_args = list(args)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Appending value %s to [%s]', args[-1], ','.join(args[:-1]))
+        return self._search(cfg, *args, field=field, mode='add')
+
+    ###########################################################################
+    def set_many(self, *args, field='value', clobber=True, cfg=None):
+        '''
+        Sets many schema parameter fields below a common keypath.
+
+        The common keypath prefix is resolved once, and each entry of the
+        dictionary is then set below it. This is equivalent to, but faster
+        than, one set() call per entry. Entries are applied in order with the
+        same type checking and error handling as set().
+
+        Args:
+            args (list): Parameter keypath prefix followed by a dictionary
+                that maps keypaths below the prefix to values. A keypath is a
+                tuple of keys, or a string for a single key.
+            field (str): Parameter field to set.
+            clobber (bool): Existing values are overwritten if True.
+            cfg(dict): Alternate dictionary to access in place of self.cfg
+
+        Examples:
+            >>> chip.set_many('eda', 'yosys', {'exe': 'yosys',
+            ...                                ('threads', 'syn', '0'): 4})
+            Sets the yosys executable and the thread count for syn0.
+        '''
+
+        if cfg is None:
+            cfg = self.cfg
+
+        prefix = args[:-1]
+        params = args[-1]
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Setting %d parameters under [%s]", len(params), ','.join(prefix))
 
-        self.logger.debug(f'Appending value {args[-1]} to [{keypathstr}]')
-        return self._search(cfg, keypathstr, *all_args, field=field, mode='add')
+        # create the prefix once, each entry is then walked from there
+        prefixslot = self._lookup(cfg, prefix, create=True)
+        if prefixslot is None:
+            self.error = 1
+            self.logger.error(f"Set/Add keypath [{','.join(prefix)}] does not exist.")
+            return None
+
+        for keypath, value in params.items():
+            if isinstance(keypath, str):
+                keypath = (keypath,)
+            self._search(cfg, *prefix, *keypath, value, field=field, mode='set',
+                         clobber=clobber, prefix=(len(prefix), prefixslot))
+
+    ###########################################################################
+    def get_many(self, *args, field='value', job=None, cfg=None):
+        '''
+        Returns many schema parameter fields below a common keypath.
+
+        Equivalent to one get() call per keypath, with the keypath prefix
+        checked once.
+
+        Args:
+            args (list): Parameter keypath prefix followed by a list of
+                keypaths below the prefix. A keypath is a tuple of keys, or a
+                string for a single key.
+            field(str): Parameter field to fetch.
+            job (str): Jobname to use for dictionary access in place of the
+                current active jobname.
+            cfg(dict): Alternate dictionary to access in place of the default
+                chip object schema dictionary.
+
+        Returns:
+            List of the values found, in the order of the keypaths given.
+
+        Examples:
+            >>> exe, version = chip.get_many('eda', 'yosys', ['exe', 'version'])
+            Returns the executable and version of the yosys tool.
+        '''
+
+        if cfg is None:
+            if job is not None:
+                cfg = self.cfghistory[job]
+            else:
+                cfg = self.cfg
+
+        prefix = args[:-1]
+        keypaths = args[-1]
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Reading %d parameters under [%s]. Field = '%s'",
+                              len(keypaths), ','.join(prefix), field)
+
+        if self._lookup(cfg, prefix) is None:
+            self.error = 1
+            self.logger.error(f"Get keypath [{','.join(prefix)}] does not exist.")
+            return [None] * len(keypaths)
+
+        # leaves of self.cfg are found in the leaf index without a walk
+        values = []
+        for keypath in keypaths:
+            if isinstance(keypath, str):
+                keypath = (keypath,)
+            values.append(self._search(cfg, *prefix, *keypath, field=field, mode='get'))
+        return values
 
 
     ###########################################################################
@@ -946,252 +1079,419 @@ class Chip:
         return keylist
 
     ###########################################################################
-    def _search(self, cfg, keypath, *args, field='value', mode='get', clobber=True):
+    def _keypaths(self):
+        '''
+        Returns a memoized list of all keypath tuples in self.cfg.
+
+        The list is rebuilt only after a write expanded a 'default' level
+        (see _lookup()) or self.cfg was replaced. It is shared and must not
+        be modified; getkeys() returns a private copy.
+        '''
+
+        self._leafindex()
+        if self._keylist is None:
+            self._keylist = [tuple(keypath) for keypath in self._allkeys(self.cfg)]
+        return self._keylist
+
+    ###########################################################################
+    def _paramindex(self, field, *values):
+        '''
+        Returns a list of the keypath tuples in self.cfg whose field matches
+        one of values.
+
+        Supported fields are 'type', which is matched by element kind (eg.
+        'file' selects both 'file' and '[file]' parameters), 'copy' (True or
+        False) and 'require'. The indexes are built on first use and then
+        kept up to date: parameters created by expanding a 'default' level
+        are added by _lookup() and writes to an indexed field move the
+        keypath, see _search().
+        '''
+
+        self._leafindex()
+        if self._fields is None:
+            self._fields = {'type': {}, 'copy': {}, 'require': {}}
+            self._index_params((), self.cfg)
+
+        keypaths = []
+        for value in values:
+            keypaths.extend(self._fields[field].get(value, ()))
+        return keypaths
+
+    ###########################################################################
+    def _index_params(self, keypath, node):
+        '''
+        Internal function that adds all parameters found under node, which
+        sits at keypath in self.cfg, to the field indexes.
+        '''
+
+        if 'defvalue' in node:
+            for field, index in self._fields.items():
+                index.setdefault(self._indexvalue(field, node), {})[keypath] = None
+        else:
+            for k, subnode in node.items():
+                self._index_params(keypath + (k,), subnode)
+
+    ###########################################################################
+    def _indexvalue(self, field, leaf):
+        '''
+        Internal function that returns the field index value of a leaf cell.
+        '''
+
+        if field == 'type':
+            return _typedesc(leaf['type']).kind
+        elif field == 'copy':
+            return leaf.get('copy') == 'true'
+        else:
+            return leaf.get(field)
+
+    ###########################################################################
+    def _leafindex(self):
+        '''
+        Returns the leaf index for self.cfg.
+
+        The index is a flat dictionary from keypath tuple to the (branch, key)
+        slot holding the leaf cell. It is filled on demand by _lookup(), so
+        each keypath is walked once, and dropped if self.cfg is replaced.
+        Slots rather than cells are indexed since writes replace the cell,
+        see _setfield().
+        '''
+
+        if self._indexcfg is not self.cfg:
+            self._index = {}
+            self._indexcfg = self.cfg
+            self._keylist = None
+            self._fields = None
+        return self._index
+
+    ###########################################################################
+    def _lookup(self, cfg, keypath, create=False, prefix=None):
+        '''
+        Internal function that returns the (branch, key) slot of the schema
+        node found at keypath, or None if the keypath does not exist. The
+        slot of the root node is (None, None).
+
+        Leaf lookups in self.cfg are served from the leaf index. Keys not
+        found at a dynamic level resolve to that level's 'default' template.
+        The template is only copied into the tree when create is True, so
+        reading a parameter never grows the schema.
+
+        A create lookup may pass prefix=(depth, slot), the slot returned by
+        an earlier create lookup of keypath[:depth], to start the walk below
+        that node instead of at the root.
         '''
-        Internal recursive function that searches the Chip schema for a
-        match to the combination of *args and fields supplied. The function is
-        used to set and get data within the dictionary.
+
+        if cfg is self.cfg:
+            slot = self._leafindex().get(keypath)
+            if slot is not None:
+                return slot
+
+        branch = None
+        key = None
+        node = cfg
+        start = 0
+        if prefix is not None:
+            start, (branch, key) = prefix
+            if branch is not None:
+                node = branch[key]
+        templated = False
+        expanded = None
+        for depth, k in enumerate(keypath[start:], start):
+            if 'defvalue' in node:
+                # can't descend past a leaf cell
+                return None
+            elif k in node:
+                branch, key = node, k
+            elif 'default' not in node or not isinstance(k, str):
+                return None
+            elif create:
+                node[k] = _own_cfg(node['default'])
+                branch, key = node, k
+                if expanded is None:
+                    expanded = depth + 1
+            else:
+                branch, key = node, 'default'
+                templated = True
+            node = branch[key]
+
+        if cfg is self.cfg and expanded is not None:
+            self._keylist = None
+            if self._fields is not None:
+                subtree = cfg
+                for k in keypath[:expanded]:
+                    subtree = subtree[k]
+                self._index_params(tuple(keypath[:expanded]), subtree)
+
+        # slots inside a 'default' template go stale once it is expanded
+        if cfg is self.cfg and not templated and 'defvalue' in node:
+            self._index[keypath] = (branch, key)
+
+        return (branch, key)
+
+    ###########################################################################
+    def _search(self, cfg, *args, field='value', mode='get', clobber=True, prefix=None):
+        '''
+        Internal function that searches the Chip schema for a match to the
+        combination of *args and fields supplied. The function is used to set
+        and get data within the dictionary.
 
         Args:
             cfg(dict): The cfg schema to search
-            keypath (str): Concatenated keypath used for error logging.
             args (str): Keypath/value variable list used for access
             field(str): Leaf cell field to access.
-            mode(str): Action (set/get/add/getkeys/getkeys)
+            mode(str): Action (set/get/add/getkeys/getcfg)
             clobber(bool): Specifies to clobber (for set action)
+            prefix(tuple): Resolved keypath prefix for set/add, see _lookup()
+
+        '''
+
+        if mode in ('set', 'add'):
+            keys = args[:-1]
+            val = args[-1]
+        else:
+            keys = args
 
+        slot = self._lookup(cfg, keys, create=(mode in ('set', 'add')), prefix=prefix)
+        if slot is not None:
+            branch, key = slot
+            node = cfg if branch is None else branch[key]
+
+        if slot is None:
+            self.error = 1
+            if mode in ('set', 'add'):
+                self.logger.error(f"Set/Add keypath [{','.join(keys)}] does not exist.")
+            else:
+                self.logger.error(f"Get keypath [{','.join(keys)}] does not exist.")
+            return None
+        elif mode == 'getcfg':
+            return node
+        elif mode == 'getkeys':
+            return node.keys()
+        elif 'defvalue' not in node:
+            self.error = 1
+            self.logger.error(f"Keypath [{','.join(keys)}] is not a parameter.")
+            return None
+        elif mode == 'get':
+            return self._getfield(node, keys, field)
+        else:
+            result = self._setfield(branch, key, keys, field, val, mode, clobber)
+            if cfg is self.cfg and self._fields is not None and field in self._fields:
+                # move the keypath to the bucket of its new field value
+                index = self._fields[field]
+                for bucket in index.values():
+                    bucket.pop(keys, None)
+                index.setdefault(self._indexvalue(field, branch[key]), {})[keys] = None
+            return result
+
+    ###########################################################################
+    def _getfield(self, leaf, keypath, field):
+        '''
+        Internal function that returns a field of a leaf cell, converting
+        stored values back to the parameter type.
+        '''
+
+        if not (field in leaf) and (field!='value'):
+            self.error = 1
+            self.logger.error(f"Field '{field}' not found for keypath [{','.join(keypath)}]")
+        elif field == 'value':
+            #Select default if no value has been set
+            if field not in leaf:
+                selval = leaf['defvalue']
+            else:
+                selval =  leaf['value']
+            # values are stored in native form, lists are copied so callers
+            # can't modify the schema through them
+            if isinstance(selval, list):
+                return list(selval)
+            return selval
+        #all non-value fields are strings (or lists of strings)
+        else:
+            if leaf[field] == 'true':
+                return True
+            elif leaf[field] == 'false':
+                return False
+            elif isinstance(leaf[field], list):
+                return list(leaf[field])
+            else:
+                return leaf[field]
+
+    ###########################################################################
+    def _setfield(self, branch, key, keypath, field, val, mode, clobber):
+        '''
+        Internal function that sets or adds to a field of the leaf cell
+        branch[key].
+
+        Leaf cells may be shared between configurations (see _copy_cfg()), so
+        the cell is never modified in place: the update is made on a copy,
+        which then replaces branch[key].
+        '''
+
+        leaf = branch[key].copy()
+        result = self._setleaf(leaf, keypath, field, val, mode, clobber)
+        branch[key] = leaf
+        return result
+
+    ###########################################################################
+    def _setleaf(self, leaf, keypath, field, val, mode, clobber):
+        '''
+        Internal function that sets or adds to a field of a private leaf
+        cell copy, see _setfield().
         '''
 
-        all_args = list(args)
-        param = all_args[0]
-        val = all_args[-1]
         empty = [None, 'null', [], 'false']
 
-        #set/add leaf cell (all_args=(param,val))
-        if (mode in ('set', 'add')) & (len(all_args) == 2):
-            # clean error if key not found
-            if (not param in cfg) & (not 'default' in cfg):
-                self.logger.error(f"Set/Add keypath [{keypath}] does not exist.")
+        desc = _typedesc(leaf['type'])
+        list_type = desc.is_list
+        # copying over defvalue if value doesn't exist
+        if 'value' not in leaf:
+            leaf['value'] = leaf['defvalue']
+        # checking for illegal fields
+        if not field in leaf and (field != 'value'):
+            self.logger.error(f"Field '{field}' for keypath [{','.join(keypath)}]' is not a valid field.")
+            self.error = 1
+        # check legality of value
+        if field == 'value':
+            (type_ok,type_error) = self._typecheck(leaf, keypath, val)
+            if not type_ok:
+                self.logger.error("%s", type_error)
                 self.error = 1
-            else:
-                # making an 'instance' of default if not found
-                if (not param in cfg) & ('default' in cfg):
-                    cfg[param] = copy.deepcopy(cfg['default'])
-                list_type =bool(re.match(r'\[', cfg[param]['type']))
-                # copying over defvalue if value doesn't exist
-                if 'value' not in cfg[param]:
-                    cfg[param]['value'] = copy.deepcopy(cfg[param]['defvalue'])
-                # checking for illegal fields
-                if not field in cfg[param] and (field != 'value'):
-                    self.logger.error(f"Field '{field}' for keypath [{keypath}]' is not a valid field.")
-                    self.error = 1
-                # check legality of value
-                if field == 'value':
-                    (type_ok,type_error) = self._typecheck(cfg[param], param, val)
-                    if not type_ok:
-                        self.logger.error("%s", type_error)
-                        self.error = 1
-                # converting python True/False to lower case string
-                if (field == 'value') and (cfg[param]['type'] == 'bool'):
-                    if val == True:
-                        val = "true"
-                    elif val == False:
-                        val = "false"
-                # checking if value has been set
-                if field not in cfg[param]:
-                    selval = cfg[param]['defvalue']
-                else:
-                    selval = cfg[param]['value']
-                # updating values
-                if cfg[param]['lock'] == "true":
-                    self.logger.debug("Ignoring {mode}{} to [{keypath}]. Lock bit is set.")
-                elif (mode == 'set'):
-                    if (selval in empty) | clobber:
-                        if field in ('copy', 'lock'):
-                            # boolean fields
-                            if val is True:
-                                cfg[param][field] = "true"
-                            elif val is False:
-                                cfg[param][field] = "false"
-                            else:
-                                self.logger.error(f'{field} must be set to boolean.')
-                                self.error = 1
-                        elif field in ('filehash', 'date', 'author', 'signature'):
-                            if isinstance(val, list):
-                                cfg[param][field] = val
-                            else:
-                                cfg[param][field] = [val]
-                        elif (not list_type) & (val is None):
-                            cfg[param][field] = None
-                        elif (not list_type) & (not isinstance(val, list)):
-                            cfg[param][field] = str(val)
-                        elif list_type & (not isinstance(val, list)):
-                            cfg[param][field] = [str(val)]
-                        elif list_type & isinstance(val, list):
-                            if re.search(r'\(', cfg[param]['type']):
-                                cfg[param][field] = list(map(str,val))
-                            else:
-                                cfg[param][field] = val
-                        else:
-                            self.logger.error(f"Assigning list to scalar for [{keypath}]")
-                            self.error = 1
+                # can't be converted to the parameter type
+                return leaf[field]
+        # checking if value has been set
+        if field not in leaf:
+            selval = leaf['defvalue']
+        else:
+            selval = leaf['value']
+        # updating values
+        if leaf['lock'] == "true":
+            self.logger.debug(f"Ignoring {mode}() to [{','.join(keypath)}]. Lock bit is set.")
+        elif (mode == 'set'):
+            if (selval is False) | (selval in empty) | clobber:
+                if field in ('copy', 'lock'):
+                    # boolean fields
+                    if val is True:
+                        leaf[field] = "true"
+                    elif val is False:
+                        leaf[field] = "false"
                     else:
-                        self.logger.debug(f"Ignoring set() to [{keypath}], value already set. Use clobber=true to override.")
-                elif (mode == 'add'):
-                    if field in ('filehash', 'date', 'author', 'signature'):
-                        cfg[param][field].append(str(val))
-                    elif field in ('copy', 'lock'):
-                        self.logger.error(f"Illegal use of add() for scalar field {field}.")
+                        self.logger.error(f'{field} must be set to boolean.')
                         self.error = 1
-                    elif list_type & (not isinstance(val, list)):
-                        cfg[param][field].append(str(val))
-                    elif list_type & isinstance(val, list):
-                        cfg[param][field].extend(val)
+                elif field in ('filehash', 'date', 'author', 'signature'):
+                    if isinstance(val, list):
+                        leaf[field] = list(val)
                     else:
-                        self.logger.error(f"Illegal use of add() for scalar parameter [{keypath}].")
-                        self.error = 1
-                return cfg[param][field]
-        #get leaf cell (all_args=param)
-        elif len(all_args) == 1:
-            if not param in cfg:
+                        leaf[field] = [val]
+                elif (not list_type) & (val is None):
+                    leaf[field] = None
+                elif (not list_type) & (not isinstance(val, list)):
+                    leaf[field] = desc.convert(val)
+                elif list_type & (not isinstance(val, list)):
+                    leaf[field] = [desc.convert(val)]
+                elif list_type:
+                    leaf[field] = desc.native(val)
+                else:
+                    self.logger.error(f"Assigning list to scalar for [{','.join(keypath)}]")
+                    self.error = 1
+            else:
+                self.logger.debug(f"Ignoring set() to [{','.join(keypath)}], value already set. Use clobber=true to override.")
+        elif (mode == 'add'):
+            if field in ('filehash', 'date', 'author', 'signature'):
+                leaf[field] = leaf[field] + [str(val)]
+            elif field in ('copy', 'lock'):
+                self.logger.error(f"Illegal use of add() for scalar field {field}.")
                 self.error = 1
-                self.logger.error(f"Get keypath [{keypath}] does not exist.")
-            elif mode == 'getcfg':
-                return cfg[param]
-            elif mode == 'getkeys':
-                return cfg[param].keys()
+            elif list_type & (not isinstance(val, list)):
+                leaf[field] = leaf[field] + [desc.convert(val)]
+            elif list_type:
+                leaf[field] = leaf[field] + desc.native(val)
             else:
-                if not (field in cfg[param]) and (field!='value'):
-                    self.error = 1
-                    self.logger.error(f"Field '{field}' not found for keypath [{keypath}]")
-                elif field == 'value':
-                    #Select default if no value has been set
-                    if field not in cfg[param]:
-                        selval = cfg[param]['defvalue']
-                    else:
-                        selval =  cfg[param]['value']
-                    #check for list
-                    if bool(re.match(r'\[', cfg[param]['type'])):
-                        sctype = re.sub(r'[\[\]]', '', cfg[param]['type'])
-                        return_list = []
-                        if selval is None:
-                            return None
-                        for item in selval:
-                            if sctype == 'int':
-                                return_list.append(int(item))
-                            elif sctype == 'float':
-                                return_list.append(float(item))
-                            elif sctype == '(str,str)':
-                                if isinstance(item,tuple):
-                                    return_list.append(item)
-                                else:
-                                    tuplestr = re.sub(r'[\(\)\'\s]','',item)
-                                    return_list.append(tuple(tuplestr.split(',')))
-                            elif sctype == '(float,float)':
-                                if isinstance(item,tuple):
-                                    return_list.append(item)
-                                else:
-                                    tuplestr = re.sub(r'[\(\)\s]','',item)
-                                    return_list.append(tuple(map(float, tuplestr.split(','))))
-                            else:
-                                return_list.append(item)
-                        return return_list
-                    else:
-                        if selval is None:
-                            # Unset scalar of any type
-                            scalar = None
-                        elif cfg[param]['type'] == "int":
-                            #print(selval, type(selval))
-                            scalar = int(float(selval))
-                        elif cfg[param]['type'] == "float":
-                            scalar = float(selval)
-                        elif cfg[param]['type'] == "bool":
-                            scalar = (selval == 'true')
-                        elif re.match(r'\(', cfg[param]['type']):
-                            tuplestr = re.sub(r'[\(\)\s]','',selval)
-                            scalar = tuple(map(float, tuplestr.split(',')))
-                        else:
-                            scalar = selval
-                        return scalar
-                #all non-value fields are strings (or lists of strings)
-                else:
-                    if cfg[param][field] == 'true':
-                        return True
-                    elif cfg[param][field] == 'false':
-                        return False
-                    else:
-                        return cfg[param][field]
-        #if not leaf cell descend tree
-        else:
-            ##copying in default tree for dynamic trees
-            if not param in cfg and 'default' in cfg:
-                cfg[param] = copy.deepcopy(cfg['default'])
-            elif not param in cfg:
+                self.logger.error(f"Illegal use of add() for scalar parameter [{','.join(keypath)}].")
                 self.error = 1
-                self.logger.error(f"Get keypath [{keypath}] does not exist.")
-                return None
-            all_args.pop(0)
-            return self._search(cfg[param], keypath, *all_args, field=field, mode=mode, clobber=clobber)
+        return leaf[field]
 
     ###########################################################################
-    def _prune(self, cfg, top=True, keeplists=False):
+    def _prune(self, cfg, keeplists=False):
         '''
-        Internal recursive function that creates a local copy of the Chip
-        schema (cfg) with only essential non-empty parameters retained.
+        Internal function that creates a local copy of the Chip schema (cfg)
+        with only essential non-empty parameters retained.
 
+        The copy is built in one pass over cfg: 'default' templates, empty
+        parameters and the help/example fields are left out, then branches
+        that ended up empty are dropped, deepest first. Parameter values are
+        shared with cfg.
         '''
 
-        # create a local copy of dict
-        if top:
-            localcfg = copy.deepcopy(cfg)
-        else:
-            localcfg = cfg
-
-        #10 should be enough for anyone...
-        maxdepth = 10
-        i = 0
-
         #Prune when the default & value are set to the following
         if keeplists:
             empty = ("null", None)
         else:
             empty = ("null", None, [])
 
-        # When at top of tree loop maxdepth times to make sure all stale
-        # branches have been removed, not elegant, but stupid-simple
-        # "good enough"
-        while i < maxdepth:
-            #Loop through all keys starting at the top
-            for k in list(localcfg.keys()):
+        localcfg = {}
+        branches = []
+        stack = [(cfg, localcfg)]
+        while stack:
+            node, localnode = stack.pop()
+            for k, subnode in node.items():
                 #removing all default/template keys
-                # reached a default subgraph, delete it
                 if k == 'default':
-                    del localcfg[k]
+                    continue
                 # reached leaf-cell
-                elif 'help' in localcfg[k].keys():
-                    del localcfg[k]['help']
-                elif 'example' in localcfg[k].keys():
-                    del localcfg[k]['example']
-                elif 'defvalue' in localcfg[k].keys():
-                    if localcfg[k]['defvalue'] in empty:
-                        if 'value' in localcfg[k].keys():
-                            if localcfg[k]['value'] in empty:
-                                del localcfg[k]
-                        else:
-                            del localcfg[k]
-                #removing stale branches
-                elif not localcfg[k]:
-                    localcfg.pop(k)
+                elif 'defvalue' in subnode:
+                    if (subnode['defvalue'] in empty and
+                        ('value' not in subnode or subnode['value'] in empty)):
+                        continue
+                    if isinstance(subnode, _Parameter):
+                        leaf = subnode.todict()
+                    else:
+                        leaf = dict(subnode)
+                    leaf.pop('help', None)
+                    leaf.pop('example', None)
+                    localnode[k] = leaf
                 #keep traversing tree
                 else:
-                    self._prune(cfg=localcfg[k], top=False, keeplists=keeplists)
-            if top:
-                i += 1
-            else:
-                break
+                    localnode[k] = {}
+                    branches.append((localnode, k))
+                    stack.append((subnode, localnode[k]))
+
+        #removing stale branches, children are listed after their parents
+        for localnode, k in reversed(branches):
+            if not localnode[k]:
+                del localnode[k]
 
         return localcfg
 
+    ###########################################################################
+    def _subtrees(self, cfg, keypaths):
+        '''
+        Internal function that returns a dictionary holding only the subtrees
+        of cfg found at keypaths. The subtrees are shared with cfg, keypaths
+        that don't exist are skipped.
+        '''
+
+        selected = {}
+        for keypath in keypaths:
+            node = cfg
+            for k in keypath:
+                if 'defvalue' in node or k not in node:
+                    node = None
+                    break
+                node = node[k]
+            if node is None:
+                continue
+
+            src = cfg
+            dst = selected
+            for k in keypath[:-1]:
+                src = src[k]
+                if dst.get(k) is src:
+                    # an enclosing subtree was selected already
+                    break
+                dst = dst.setdefault(k, {})
+            else:
+                dst[keypath[-1]] = node
+
+        return selected
+
     ###########################################################################
     def _find_sc_file(self, filename, missing_ok=False):
         """
@@ -1299,7 +1599,7 @@ class Chip:
             self.error = 1
             return None
 
-        is_list = bool(re.match(r'\[', paramtype))
+        is_list = _typedesc(paramtype).is_list
 
         paths = self.get(*keypath, cfg=cfg)
         # Convert to list if we have scalar
@@ -1375,6 +1675,176 @@ class Chip:
             self.error = 1
             return None
 
+    ###########################################################################
+    def find_manifest(self, step, jobname='job0', index='0'):
+        """
+        Returns the absolute path of the manifest a task wrote.
+
+        Tasks write their output manifest in msgpack form
+        (<design>.pkg.msgpack) when msgpack is installed, and in json form
+        (<design>.pkg.json) otherwise. Either can be read with
+        read_manifest(). Use find_result() to look for one of the forms.
+
+        Args:
+            step (str): Task step name ('syn', 'place', etc)
+            jobname (str): Jobid directory name
+            index (str): Task index
+
+        Returns:
+            Returns absolute path to the manifest, or None if the task
+            didn't write one.
+
+        Examples:
+            >>> chip.read_manifest(chip.find_manifest('syn'))
+           Reads the manifest of the syn task into the chip.
+        """
+
+        workdir = self._getworkdir(jobname, step, index)
+        filename = self._handoff_manifest(f"{workdir}/outputs")
+
+        self.logger.debug("Finding manifest %s", filename)
+
+        if os.path.isfile(filename):
+            return filename
+        else:
+            self.error = 1
+            return None
+
+    ###########################################################################
+    def _write_delta(self, filename):
+        '''
+        Writes the parameters changed since run() wrote its base manifest
+        to a compact json or a msgpack file, along with the path of the base
+        relative to the file. See read_manifest().
+        '''
+
+        filepath = os.path.abspath(filename)
+        self.logger.info('Writing manifest to %s', filepath)
+
+        delta = _delta_cfg(self.cfg, self._deltacfg)
+        base = os.path.relpath(self._deltabase, os.path.dirname(filepath))
+
+        if filepath.endswith('.msgpack'):
+            delta['__delta__'] = {'base': base}
+            self._write_msgpack(delta, filepath)
+        else:
+            delta = _encode_cfg(delta)
+            delta['__delta__'] = {'base': base}
+            with open(filepath, 'w') as f:
+                f.write(utils.json_dumps(delta, compact=True))
+
+    ###########################################################################
+    def _write_base(self, jobdir):
+        '''
+        Internal function that writes the base manifest of the delta
+        manifests of a run to jobdir, and returns its path.
+
+        Bases are named after the digest of their content, so runs with an
+        unchanged configuration share one. Outputs of earlier runs of the
+        job may still refer to older bases, so these are never overwritten:
+        a new base is written to a temporary file and renamed into place.
+        '''
+
+        design = self.get('design')
+        digest = self.digest_manifest()
+        basefile = self._handoff_manifest(jobdir, name=f"{design}.base-{digest[:16]}",
+                                          write=True)
+        if os.path.isfile(basefile):
+            return basefile
+
+        suffix = basefile[len(os.path.join(jobdir, f"{design}.base-{digest[:16]}")):]
+        fd, tmpfile = tempfile.mkstemp(suffix=suffix, prefix=f".{design}.base-", dir=jobdir)
+        os.close(fd)
+        try:
+            self.write_manifest(tmpfile, compact=True)
+            os.replace(tmpfile + '.digest', basefile + '.digest')
+            os.replace(tmpfile, basefile)
+        finally:
+            for path in (tmpfile, tmpfile + '.digest'):
+                if os.path.isfile(path):
+                    os.remove(path)
+        return basefile
+
+    ###########################################################################
+    def _remove_bases(self, jobdir):
+        '''
+        Internal function that removes the base manifests in jobdir that no
+        delta manifest of a task of the job refers to, other than the one
+        of the current run.
+        '''
+
+        design = self.get('design')
+        used = {self._deltabase}
+        for path in glob.glob(os.path.join(jobdir, '*', '*', '*', f"{design}.pkg.*")):
+            with open(path, 'rb') as f:
+                data = f.read()
+            # full manifests need no parsing
+            if b'__delta__' not in data:
+                continue
+            if path.endswith('.msgpack'):
+                if utils.msgpack is None:
+                    # can't tell which base the delta needs
+                    return
+                cfg = utils.msgpack_loads(data)
+            else:
+                cfg = utils.json_loads(data)
+            if '__delta__' in cfg:
+                basefile = os.path.join(os.path.dirname(path), cfg['__delta__']['base'])
+                used.add(os.path.normpath(basefile))
+
+        for path in glob.glob(os.path.join(jobdir, f"{design}.base*.pkg.*")):
+            # along with the files stored next to the base
+            basefile = re.sub(r'\.(digest|idx)$', '', path)
+            if os.path.abspath(basefile) not in used:
+                self.logger.debug('Removing unused base manifest file %s', path)
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    ###########################################################################
+    def _write_msgpack(self, cfg, filepath):
+        '''
+        Internal function that writes cfg to a msgpack manifest. Values are
+        stored natively rather than in their manifest string form, so the
+        file is tagged with the schema version it was written for, see
+        read_manifest().
+        '''
+
+        if utils.msgpack is None:
+            self.logger.error('msgpack must be installed to write %s', filepath)
+            self.error = 1
+            return
+
+        cfg['__schema__'] = self.get('version', 'schema')
+        with open(filepath, 'wb') as f:
+            f.write(utils.msgpack_dumps(cfg))
+
+    ###########################################################################
+    def _handoff_manifest(self, dirname, name=None, write=False):
+        '''
+        Internal function that returns the path of the manifest passed
+        between tasks in dirname, named after the design by default.
+
+        Tasks write it in msgpack form when msgpack is installed, and as
+        json otherwise. For reading, the file in the preferred form is
+        returned if it exists, else the one in the other form.
+        '''
+
+        if name is None:
+            name = self.get('design')
+        if utils.msgpack is not None:
+            suffixes = ('pkg.msgpack', 'pkg.json')
+        else:
+            suffixes = ('pkg.json', 'pkg.msgpack')
+        paths = [os.path.join(dirname, f"{name}.{suffix}") for suffix in suffixes]
+
+        if not write:
+            for path in paths:
+                if os.path.isfile(path):
+                    return path
+        return paths[0]
+
     ###########################################################################
     def _abspath(self, cfg):
         '''
@@ -1382,12 +1852,13 @@ class Chip:
         relative paths where required.
         '''
 
+        # cfg is a (pruned) copy of parts of self.cfg, so its file and dir
+        # parameters are found in the type index and resolved in self.cfg
+        pathkeys = set(self._paramindex('type', 'file', 'dir'))
         for keypath in self.getkeys(cfg=cfg):
-            paramtype = self.get(*keypath, cfg=cfg, field='type')
-
             #only do something if type is file or dir
-            if 'file' in paramtype or 'dir' in paramtype:
-                abspaths = self.find_files(*keypath, cfg=cfg, missing_ok=True)
+            if tuple(keypath) in pathkeys:
+                abspaths = self.find_files(*keypath, missing_ok=True)
                 self.set(*keypath, abspaths, cfg=cfg)
 
     ###########################################################################
@@ -1403,59 +1874,72 @@ class Chip:
                 print(f"{keypath},{value}", file=file)
 
     ###########################################################################
-    def _print_tcl(self, cfg, keys=None, file=None, prefix=""):
+    def _print_tcl(self, cfg, file=None, prefix=""):
         '''
         Prints out schema as TCL dictionary
+
+        The tree is walked without recursion and each parameter is written
+        to file (stdout by default) as soon as it is reached. How values are
+        quoted is worked out once per parameter type: numbers and booleans
+        are written as is, only other values are checked for $VAR
+        references and ';'.
         '''
 
-        #TODO: simplify, no need for recursion
-        if keys is None:
-            keys = []
-        for k in cfg:
-            newkeys = keys.copy()
-            newkeys.append(k)
-            #detect leaf cell
-            if 'defvalue' in cfg[k]:
-                if 'value' not in cfg[k]:
-                    selval = cfg[k]['defvalue']
-                else:
-                    selval =  cfg[k]['value']
-                if bool(re.match(r'\[', str(cfg[k]['type']))):
-                    alist = selval
-                else:
-                    alist = [selval]
-                for i, val in enumerate(alist):
-                    #replace $VAR with env(VAR) for tcl
-                    m = re.match(r'\$(\w+)(.*)', str(val))
+        if file is None:
+            file = sys.stdout
+
+        def plain(alist):
+            return ' '.join(map(str, alist))
+
+        def quoted(alist):
+            items = []
+            for val in alist:
+                val = str(val)
+                #replace $VAR with env(VAR) for tcl
+                if val.startswith('$'):
+                    m = re.match(r'\$(\w+)(.*)', val)
                     if m:
-                        alist[i] = ('$env(' +
-                                    m.group(1) +
-                                    ')' +
-                                    m.group(2))
+                        val = '$env(' + m.group(1) + ')' + m.group(2)
+                items.append(val)
+            return ' '.join(items).replace(';', '\\;')
+
+        formatters = {}
+        keys = []
+        stack = [iter(cfg.items())]
+        while stack:
+            for k, node in stack[-1]:
+                #detect leaf cell
+                if 'defvalue' not in node:
+                    keys.append(k)
+                    stack.append(iter(node.items()))
+                    break
 
-                #create a TCL dict
-                keystr = ' '.join(newkeys)
-                valstr = ' '.join(map(str, alist)).replace(';', '\\;')
-                outlst = [prefix,
-                          keystr,
-                          '[list ',
-                          valstr,
-                          ']']
-                outstr = ' '.join(outlst)
-                outstr = outstr + '\n'
-                #print out value
-                if file is None:
-                    print(outstr)
+                sctype = node['type']
+                if sctype not in formatters:
+                    desc = _typedesc(sctype)
+                    if desc.kind in ('int', 'float', 'bool'):
+                        formatters[sctype] = (desc.is_list, plain)
+                    else:
+                        formatters[sctype] = (desc.is_list, quoted)
+                is_list, formatter = formatters[sctype]
+
+                if 'value' not in node:
+                    selval = node['defvalue']
                 else:
-                    print(outstr, file=file)
+                    selval = node['value']
+                valstr = formatter(selval if is_list else [selval])
+
+                #create a TCL dict
+                keystr = ' '.join(keys + [k])
+                file.write(f"{prefix} {keystr} [list  {valstr} ]\n\n")
             else:
-                self._print_tcl(cfg[k],
-                               keys=newkeys,
-                               file=file,
-                               prefix=prefix)
+                stack.pop()
+                if keys:
+                    keys.pop()
 
     ###########################################################################
-    def merge_manifest(self, cfg, job=None, clobber=True, clear=True, check=False):
+    def merge_manifest(self, cfg, job=None, clobber=True, clear=True, check=False,
+                       typecheck=True):
         """
         Merges an external manifest with the current compilation manifest.
 
@@ -1468,6 +1952,9 @@ class Chip:
             clear (bool): If True, disables append operations for list type
             clobber (bool): If True, overwrites existing parameter value
             check (bool): If True, checks the validity of each key
+            typecheck (bool): If False, values are trusted to be in native
+                form and agree with the parameter type, as they do in
+                manifests written by SC.
 
         Examples:
             >>> chip.merge_manifest('my.pkg.json')
@@ -1475,37 +1962,174 @@ class Chip:
 
         """
 
+        previous = None
         if job is not None:
             # fill ith default schema before populating
-            self.cfghistory[job] = schema_cfg()
+            previous = self.cfghistory.get(job)
+            self.cfghistory[job] = _own_cfg(_schema_template())
             dst = self.cfghistory[job]
         else:
             dst = self.cfg
+            self._leafindex()
+
+        self._merge_node(cfg, dst, (), dst is self.cfg, clobber, clear, check, typecheck)
+
+        if isinstance(previous, _ManifestView):
+            previous.close()
+
+    ###########################################################################
+    def _merge_node(self, src, dst, keypath, indexed, clobber, clear, check, typecheck):
+        '''
+        Internal function that merges the manifest node src into the schema
+        node dst found at keypath, walking both trees in lockstep.
+
+        Returns dst, or the copy of dst holding the changes when dst is a
+        leaf cell, which is never modified in place. indexed is True when dst is part of self.cfg and covered by
+        the leaf and field indexes.
+        '''
 
-        for keylist in self.getkeys(cfg=cfg):
-            #only read in valid keypaths without 'default'
-            key_valid = True
-            if check:
-                key_valid = self.valid(*keylist, quiet=False, default_valid=True)
-            if key_valid and 'default' not in keylist:
-                # update value, handling scalars vs. lists
-                typestr = self.get(*keylist, cfg=cfg, field='type')
-                val = self.get(*keylist, cfg=cfg)
-                arg = keylist.copy()
-                arg.append(val)
-                if bool(re.match(r'\[', typestr)) & bool(not clear):
-                    self.add(*arg, cfg=dst)
+        if 'defvalue' in dst:
+            return self._merge_param(src, dst, keypath, indexed, clobber, clear, typecheck)
+
+        node = dst
+        for k, subsrc in src.items():
+            if k == 'default':
+                continue
+            subkeypath = keypath + (k,)
+            if k in node:
+                subdst = node[k]
+                expanded = False
+            elif 'default' in node:
+                subdst = _own_cfg(node['default'])
+                expanded = True
+            else:
+                for leafpath in self._merge_leafpaths(subsrc, subkeypath):
+                    if check:
+                        self.logger.warning(f"Keypath [{','.join(leafpath)}] is not valid")
+                    else:
+                        self.error = 1
+                        self.logger.error(f"Set/Add keypath [{','.join(leafpath)}] does not exist.")
+                continue
+
+            if 'defvalue' in subsrc and 'defvalue' not in subdst:
+                self.error = 1
+                self.logger.error(f"Keypath [{','.join(subkeypath)}] is not a parameter.")
+                continue
+            elif 'defvalue' not in subsrc and 'defvalue' in subdst:
+                for leafpath in self._merge_leafpaths(subsrc, subkeypath):
+                    self.error = 1
+                    self.logger.error(f"Set/Add keypath [{','.join(leafpath)}] does not exist.")
+                continue
+
+            merged = self._merge_node(subsrc, subdst, subkeypath, indexed and not expanded,
+                                      clobber, clear, check, typecheck)
+            if merged is subdst and not expanded:
+                continue
+            node[k] = merged
+            if indexed and expanded:
+                self._keylist = None
+                if self._fields is not None:
+                    self._index_params(subkeypath, merged)
+            elif indexed and 'defvalue' in merged:
+                self._index[subkeypath] = (node, k)
+
+        return node
+
+    ###########################################################################
+    def _merge_param(self, src, dst, keypath, indexed, clobber, clear, typecheck):
+        '''
+        Internal function that merges the manifest leaf cell src into the
+        schema leaf cell dst found at keypath. Returns dst if nothing
+        changed, otherwise an updated copy.
+        '''
+
+        val = src['value'] if 'value' in src else src['defvalue']
+        if isinstance(val, list):
+            val = list(val)
+
+        # Special case to ensure loglevel is updated ASAP
+        if keypath == ('loglevel',):
+            self.logger.setLevel(val)
+
+        leaf = dst.copy()
+        changed = 'value' not in dst
+        if changed:
+            leaf['value'] = leaf['defvalue']
+
+        if dst['lock'] == "true":
+            if typecheck:
+                (type_ok, type_error) = self._typecheck(dst, keypath, val)
+                if not type_ok:
+                    self.logger.error("%s", type_error)
+                    self.error = 1
+            self.logger.debug(f"Ignoring merge to [{','.join(keypath)}]. Lock bit is set.")
+            return leaf if changed else dst
+
+        # update value, handling scalars vs. lists
+        list_type = _typedesc(leaf['type']).is_list
+        if typecheck:
+            mode = 'add' if list_type and not clear else 'set'
+            self._setleaf(leaf, keypath, 'value', val, mode, clobber)
+        elif list_type and not clear:
+            leaf['value'] = leaf['value'] + (val if isinstance(val, list) else [val])
+        elif clobber or _empty_value(leaf['value']):
+            leaf['value'] = val
+        changed = changed or leaf['value'] != dst['value']
+
+        # update other fields that a user might modify
+        for field in src:
+            if field in ('value', 'switch', 'type', 'require', 'defvalue',
+                         'shorthelp', 'example', 'help'):
+                # skip these fields (value handled above, others are static)
+                continue
+            v = src[field]
+            if field not in leaf:
+                self.logger.error(f"Field '{field}' for keypath [{','.join(keypath)}]' is not a valid field.")
+                self.error = 1
+                continue
+            elif field in ('copy', 'lock'):
+                # boolean fields
+                if v in (True, 'true'):
+                    v = "true"
+                elif v in (False, 'false'):
+                    v = "false"
                 else:
-                    self.set(*arg, cfg=dst, clobber=clobber)
+                    self.logger.error(f'{field} must be set to boolean.')
+                    self.error = 1
+                    continue
+            elif isinstance(v, list):
+                v = list(v)
+            elif field in ('filehash', 'date', 'author', 'signature'):
+                v = [v]
+            if leaf[field] != v:
+                leaf[field] = v
+                changed = True
+
+        if not changed:
+            return dst
+
+        if indexed and self._fields is not None:
+            # move the keypath to the bucket of its new field value
+            for field, index in self._fields.items():
+                old = self._indexvalue(field, dst)
+                new = self._indexvalue(field, leaf)
+                if old != new:
+                    index.get(old, {}).pop(keypath, None)
+                    index.setdefault(new, {})[keypath] = None
+
+        return leaf
 
-                # update other fields that a user might modify
-                for field in self.getdict(*keylist, cfg=cfg).keys():
-                    if field in ('value', 'switch', 'type', 'require', 'defvalue',
-                                 'shorthelp', 'example', 'help'):
-                        # skip these fields (value handled above, others are static)
-                        continue
-                    v = self.get(*keylist, cfg=cfg, field=field)
-                    self.set(*keylist, v, cfg=dst, field=field)
+    ###########################################################################
+    def _merge_leafpaths(self, src, keypath):
+        '''
+        Internal function that returns the keypaths of all leaf cells in the
+        manifest node src found at keypath, for error reporting.
+        '''
+
+        if 'defvalue' in src:
+            return [keypath]
+        return [keypath + tuple(keylist) for keylist in self._allkeys(src)
+                if 'default' not in keylist]
 
     ###########################################################################
     def _keypath_empty(self, key):
@@ -1526,36 +2150,32 @@ class Chip:
         allowed_paths = [os.path.join(self.cwd, self.get('dir'))]
         allowed_paths.extend(os.environ['SC_VALID_PATHS'].split(os.pathsep))
 
-        for keypath in self.getkeys():
+        for keypath in self._paramindex('type', 'file', 'dir'):
             if 'default' in keypath:
                 continue
 
-            paramtype = self.get(*keypath, field='type')
-            #only do something if type is file or dir
-            if 'file' in paramtype or 'dir' in paramtype:
-
-                if self.get(*keypath) is None:
-                    # skip unset values (some directories are None by default)
-                    continue
+            if self.get(*keypath) is None:
+                # skip unset values (some directories are None by default)
+                continue
 
-                abspaths = self.find_files(*keypath, missing_ok=True)
-                if not isinstance(abspaths, list):
-                    abspaths = [abspaths]
+            abspaths = self.find_files(*keypath, missing_ok=True)
+            if not isinstance(abspaths, list):
+                abspaths = [abspaths]
 
-                for abspath in abspaths:
-                    ok = False
+            for abspath in abspaths:
+                ok = False
 
-                    if abspath is not None:
-                        for allowed_path in allowed_paths:
-                            if os.path.commonpath([abspath, allowed_path]) == allowed_path:
-                                ok = True
-                                continue
+                if abspath is not None:
+                    for allowed_path in allowed_paths:
+                        if os.path.commonpath([abspath, allowed_path]) == allowed_path:
+                            ok = True
+                            continue
 
-                    if not ok:
-                        self.logger.error(f'Keypath {keypath} contains path(s) '
-                            'that do not exist or resolve to files outside of '
-                            'allowed directories.')
-                        return False
+                if not ok:
+                    self.logger.error(f'Keypath {keypath} contains path(s) '
+                        'that do not exist or resolve to files outside of '
+                        'allowed directories.')
+                    return False
 
         return True
 
@@ -1599,18 +2219,16 @@ class Chip:
             self.logger.error("Flowgraph doesn't contain import step.")
 
         #2. Check requirements list
-        allkeys = self.getkeys()
-        for key in allkeys:
-            keypath = ",".join(key)
-            if 'default' not in key:
-                key_empty = self._keypath_empty(key)
-                requirement = self.get(*key, field='require')
-                if key_empty and (str(requirement) == 'all'):
-                    self.error = 1
-                    self.logger.error(f"Global requirement missing for [{keypath}].")
-                elif key_empty and (str(requirement) == self.get('mode')):
+        for key in self._paramindex('require', 'all'):
+            if 'default' not in key and self._keypath_empty(key):
+                self.error = 1
+                self.logger.error(f"Global requirement missing for [{','.join(key)}].")
+        mode = self.get('mode')
+        if mode not in (None, 'all'):
+            for key in self._paramindex('require', mode):
+                if 'default' not in key and self._keypath_empty(key):
                     self.error = 1
-                    self.logger.error(f"Mode requirement missing for [{keypath}].")
+                    self.logger.error(f"Mode requirement missing for [{','.join(key)}].")
 
         #3. Check per tool parameter requirements (when tool exists)
         for step in steplist:
@@ -1754,21 +2372,39 @@ class Chip:
         return True
 
     ###########################################################################
-    def read_manifest(self, filename, job=None, update=True, clear=True, clobber=True):
+    def read_manifest(self, filename, job=None, update=True, clear=True, clobber=True,
+                      lazy=False):
         """
         Reads a manifest from disk and merges it with the current compilation manifest.
 
         The file format read is determined by the filename suffix. Currently
-        json (*.json) and yaml(*.yaml) formats are supported.
+        json (*.json), yaml(*.yaml) and msgpack (*.msgpack) formats are
+        supported. Values in msgpack manifests are only type checked if the
+        manifest was written for a different schema version.
+
+        Task output manifests written by run() are deltas that only hold the
+        parameters changed since the start of the job. They are applied on
+        top of their base manifest, which is read first. While the chip
+        still holds the configuration of the base (ie. within run()), only
+        the changes are read and merged.
 
         Args:
             filename (filepath): Path to a manifest file to be loaded.
             update (bool): If True, manifest is merged into chip object.
             clear (bool): If True, disables append operations for list type.
             clobber (bool): If True, overwrites existing parameter value.
+            lazy (bool): If True, json manifests written with an offset
+                index (see write_manifest()) are not read up front. A
+                read-only view that decodes the parts of the file accessed
+                through it is returned instead, and becomes the
+                configuration of job. Ignored when merging into the
+                current configuration. A view returned with update=False
+                has to be closed with its close() method, or used in a
+                with statement.
 
         Returns:
-            A manifest dictionary.
+            A manifest dictionary. Only the changes are returned for a delta
+            manifest merged into a chip holding its base.
 
         Examples:
             >>> chip.read_manifest('mychip.json')
@@ -1778,31 +2414,165 @@ class Chip:
         abspath = os.path.abspath(filename)
         self.logger.debug('Reading manifest %s', abspath)
 
-        #Read arguments from file based on file type
-        with open(abspath, 'r') as f:
-            if abspath.endswith('.json'):
-                localcfg = json.load(f)
-            elif abspath.endswith('.yaml') | abspath.endswith('.yml'):
-                localcfg = yaml.load(f, Loader=yaml.SafeLoader)
-            else:
-                self.error = 1
-                self.logger.error('Illegal file format. Only json/yaml supported')
-        f.close()
+        if lazy and (job is not None or not update):
+            view = self._manifest_view(abspath)
+            if view is not None:
+                if update:
+                    previous = self.cfghistory.get(job)
+                    if isinstance(previous, _ManifestView):
+                        previous.close()
+                    self.cfghistory[job] = view
+                return view
+
+        localcfg, typecheck = self._load_manifest(abspath, update and job is None)
+        if localcfg is None:
+            return None
 
         #Merging arguments with the Chip configuration
         if update:
-            self.merge_manifest(localcfg, job=job, clear=clear, clobber=clobber)
+            self.merge_manifest(localcfg, job=job, clear=clear, clobber=clobber,
+                                typecheck=typecheck)
 
         return localcfg
 
     ###########################################################################
-    def write_manifest(self, filename, prune=True, abspath=False, job=None):
+    def _load_manifest(self, abspath, merging):
+        '''
+        Internal function that reads and decodes the manifest file abspath,
+        see read_manifest(). merging is True if the result is to be merged
+        into self.cfg, in which case a delta manifest against the base
+        self.cfg holds is returned as is.
+
+        Returns:
+            The manifest dictionary, or None if it can't be read, and
+            whether its values need type checking when merged.
+        '''
+
+        #Read arguments from file based on file type
+        if abspath.endswith('.msgpack'):
+            if utils.msgpack is None:
+                self.error = 1
+                self.logger.error('msgpack must be installed to read %s', abspath)
+                return (None, False)
+            with open(abspath, 'rb') as f:
+                localcfg = utils.msgpack_load(f)
+        else:
+            with open(abspath, 'r') as f:
+                if abspath.endswith('.json'):
+                    localcfg = utils.json_load(f)
+                elif abspath.endswith('.yaml') | abspath.endswith('.yml'):
+                    localcfg = utils.yaml_load(f)
+                else:
+                    self.error = 1
+                    self.logger.error('Illegal file format. Only json/yaml/msgpack supported')
+                    return (None, False)
+
+        # delta manifests are only written by SC, as are tagged binary ones
+        delta = localcfg.pop('__delta__', None)
+        typecheck = delta is None
+        if abspath.endswith('.msgpack'):
+            schema = localcfg.pop('__schema__', None)
+            typecheck = schema != self.get('version', 'schema')
+            if typecheck:
+                self.logger.warning(f"Manifest {abspath} was written for schema "
+                                    f"version {schema}, checking all values.")
+
+        # manifests store values as strings, except for msgpack ones written
+        # for this schema, where only tuples need converting back from lists
+        _decode_cfg(localcfg, tuples_only=not typecheck and abspath.endswith('.msgpack'))
+
+        # apply a delta manifest on top of its base, which may be a delta too
+        if delta is not None:
+            basefile = os.path.join(os.path.dirname(abspath), delta['base'])
+            basefile = os.path.normpath(basefile)
+            if not (merging and basefile == self._deltabase):
+                basecfg = self.read_manifest(basefile, update=False)
+                localcfg = _overlay_cfg(basecfg, localcfg)
+
+        return (localcfg, typecheck)
+
+    ###########################################################################
+    def _read_inputs(self, cfgfiles):
+        '''
+        Internal function that merges the manifests of a task's inputs into
+        the chip, with the result of read_manifest(clobber=False) on each
+        of them in order.
+
+        Large manifests are read and decoded by a thread pool, which overlaps
+        their file I/O, and then all are combined pairwise in a tree (see
+        _reduce_cfg()), so that the configuration is only merged into once.
+        '''
+
+        if not cfgfiles:
+            return
+
+        def load(cfgfile):
+            return self._load_manifest(os.path.abspath(cfgfile), True)
+
+        # small deltas load faster than the pool threads start
+        size = sum(os.path.getsize(f) for f in cfgfiles if os.path.isfile(f))
+        if len(cfgfiles) == 1 or size < 1000000:
+            manifests = [load(cfgfile) for cfgfile in cfgfiles]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(cfgfiles), 16)) as pool:
+                manifests = list(pool.map(load, cfgfiles))
+        manifests = [manifest for manifest in manifests if manifest[0] is not None]
+        if not manifests:
+            return
+
+        # pairwise reduction, each level halves the number of manifests
+        while len(manifests) > 1:
+            reduced = []
+            for i in range(0, len(manifests) - 1, 2):
+                (cfg, typecheck), (other, other_typecheck) = manifests[i:i+2]
+                reduced.append((_reduce_cfg(cfg, other), typecheck or other_typecheck))
+            if len(manifests) % 2:
+                reduced.append(manifests[-1])
+            manifests = reduced
+
+        cfg, typecheck = manifests[0]
+        self.merge_manifest(cfg, clobber=False, typecheck=typecheck)
+
+    ###########################################################################
+    def _manifest_view(self, filename):
+        '''
+        Internal function that returns a lazy view of the json manifest
+        filename, or None if it has no offset index matching the file.
+        '''
+
+        indexfile = filename + '.idx'
+        if not filename.endswith('.json') or not os.path.isfile(indexfile):
+            return None
+        with open(indexfile, 'r') as f:
+            index = utils.json_load(f)
+        stat = os.stat(filename)
+        if (index['size'], index['mtime']) != (stat.st_size, stat.st_mtime_ns):
+            self.logger.debug('Ignoring outdated index %s', indexfile)
+            return None
+
+        return _ManifestView(filename, index['index'], schema=_schema_template(),
+                             merge=self._merge_view)
+
+    ###########################################################################
+    def _merge_view(self, src, dst, keypath):
+        '''
+        Internal function that merges the node src decoded by a manifest view
+        into dst, a copy of the schema node at keypath, the way
+        merge_manifest() merges a manifest into a job.
+        '''
+
+        return self._merge_node(src, dst, keypath, False, True, True, False, True)
+
+    ###########################################################################
+    def write_manifest(self, filename, prune=True, abspath=False, job=None, compact=False,
+                       keypaths=None, index=False):
         '''
         Writes the compilation manifest to a file.
 
         The write file format is determined by the filename suffix. Currently
         json (*.json), yaml (*.yaml), tcl (*.tcl), and (*.csv) formats are
-        supported.
+        supported, as well as the binary msgpack (*.msgpack) format when the
+        msgpack package is installed.
 
         Args:
             filename (filepath): Output filepath
@@ -1810,6 +2580,21 @@ class Chip:
                  the Chip object schema are written to the output file.
             abspath (bool): If set to True, then all schema filepaths
                  are resolved to absolute filepaths.
+            compact (bool): If True, json files are written without
+                 indentation, using a faster json library when one is
+                 installed. Meant for manifests read back by SC rather than
+                 by people.
+            keypaths (list): If given, only the parameters below these
+                 keypaths (lists of keys) are written to the output file.
+            index (bool): If True, an offset index of json files is
+                 written to <filename>.idx, which lets read_manifest()
+                 decode only the parts of the file that are accessed.
+
+        The digest of the written manifest (see digest_manifest()) is
+        stored in <filename>.digest, and the file is left alone when it
+        already holds the same manifest, written with the same options by
+        any chip and not modified since. Manifests written with abspath=True
+        depend on the files found, and are always written.
 
         Examples:
             >>> chip.write_manifest('mydump.json')
@@ -1819,50 +2604,185 @@ class Chip:
         filepath = os.path.abspath(filename)
         self.logger.info('Writing manifest to %s', filepath)
 
+        written = None
+        if not abspath:
+            written = (prune, compact, index,
+                       [list(keypath) for keypath in keypaths] if keypaths else None)
+            if self._unchanged_manifest(filepath, written):
+                self.logger.debug('Manifest %s is unchanged, not rewriting it', filepath)
+                return
+
         if not os.path.exists(os.path.dirname(filepath)):
             os.makedirs(os.path.dirname(filepath))
 
-        if prune:
-            self.logger.debug('Pruning dictionary before writing file %s', filepath)
-            # Keep empty lists to simplify TCL coding
-            if filepath.endswith('.tcl'):
-                keeplists = True
-            else:
-                keeplists = False
-            cfgcopy = self._prune(self.cfg, keeplists=keeplists)
-        else:
-            cfgcopy = copy.deepcopy(self.cfg)
-
-        # resolve absolute paths
-        if abspath:
-            self._abspath(cfgcopy)
-
-        # TODO: fix
-        #remove long help (adds no value)
-        #allkeys = self.getkeys(cfg=cfgcopy)
-        #for key in allkeys:
-        #    self.set(*key, "...", cfg=cfgcopy, field='help')
+        # Keep empty lists to simplify TCL coding
+        cfgcopy = self._manifest_cfg(prune, abspath, keypaths,
+                                     keeplists=filepath.endswith('.tcl'))
+
+        digest = None
+        if written:
+            digest = _digest_cfg(cfgcopy)
+            if self._unchanged_manifest(filepath, written, digest=digest):
+                self.logger.debug('Manifest %s is unchanged, not rewriting it', filepath)
+                self._record_manifest(filepath, written)
+                return
+
+        # binary manifests keep values in native form
+        if filepath.endswith('.msgpack'):
+            self._write_msgpack(cfgcopy, filepath)
+            if written:
+                self._record_manifest(filepath, written, digest=digest)
+            return
 
         # format specific dumping
         with open(filepath, 'w') as f:
-            if filepath.endswith('.json'):
-                print(json.dumps(cfgcopy, indent=4, sort_keys=True), file=f)
+            if filepath.endswith('.json') and index:
+                # offsets down to eg. metric,<step>,<index>
+                text, offsets = utils.json_dumps_indexed(_encode_cfg(cfgcopy), 3, compact=compact)
+                print(text, file=f)
+            elif filepath.endswith('.json'):
+                print(utils.json_dumps(_encode_cfg(cfgcopy), compact=compact), file=f)
             elif filepath.endswith('.yaml') | filepath.endswith('yml'):
-                print(yaml.dump(cfgcopy, Dumper=YamlIndentDumper, default_flow_style=False), file=f)
+                print(utils.yaml_dumps(_encode_cfg(cfgcopy)), file=f)
             elif filepath.endswith('.core'):
                 cfgfuse = self._dump_fusesoc(cfgcopy)
                 print("CAPI=2:", file=f)
-                print(yaml.dump(cfgfuse, Dumper=YamlIndentDumper, default_flow_style=False), file=f)
+                print(utils.yaml_dumps(cfgfuse), file=f)
             elif filepath.endswith('.tcl'):
                 print("#############################################", file=f)
                 print("#!!!! AUTO-GENERATED FILE. DO NOT EDIT!!!!!!", file=f)
                 print("#############################################", file=f)
-                self._print_tcl(cfgcopy, prefix="dict set sc_cfg", file=f)
+                self._print_tcl(_encode_cfg(cfgcopy), prefix="dict set sc_cfg", file=f)
             elif filepath.endswith('.csv'):
                 self._print_csv(cfgcopy, file=f)
             else:
                 self.logger.error('File format not recognized %s', filepath)
                 self.error = 1
+                written = None
+
+        if filepath.endswith('.json') and index:
+            # the index is only used while it matches the manifest file
+            stat = os.stat(filepath)
+            with open(filepath + '.idx', 'w') as f:
+                f.write(utils.json_dumps({'size': stat.st_size,
+                                          'mtime': stat.st_mtime_ns,
+                                          'index': offsets}, compact=True))
+
+        if written:
+            self._record_manifest(filepath, written, digest=digest)
+
+    ###########################################################################
+    def digest_manifest(self, prune=True, abspath=False, keypaths=None):
+        '''
+        Returns a content digest of the compilation manifest.
+
+        The digest covers the parameters write_manifest() writes with the
+        same arguments, and is the same whatever the file format, so callers
+        can key on the identity of a manifest.
+
+        Args:
+            prune (bool): If True, only essential non-empty parameters are
+                 included.
+            abspath (bool): If set to True, then all schema filepaths
+                 are resolved to absolute filepaths.
+            keypaths (list): If given, only the parameters below these
+                 keypaths (lists of keys) are included.
+
+        Returns:
+            Digest of the manifest as a sha256 hex string.
+
+        Examples:
+            >>> digest = chip.digest_manifest()
+            Returns the digest of the pruned chip manifest.
+        '''
+
+        return _digest_cfg(self._manifest_cfg(prune, abspath, keypaths))
+
+    ###########################################################################
+    def _manifest_cfg(self, prune, abspath, keypaths, keeplists=False):
+        '''
+        Internal function that returns the copy of the configuration
+        written by write_manifest() and digested by digest_manifest().
+        '''
+
+        cfg = self.cfg
+        if keypaths:
+            cfg = self._subtrees(cfg, keypaths)
+
+        if prune:
+            self.logger.debug('Pruning dictionary')
+            cfgcopy = self._prune(cfg, keeplists=keeplists)
+        else:
+            cfgcopy = _copy_cfg(cfg)
+
+        # resolve absolute paths
+        if abspath:
+            self._abspath(cfgcopy)
+
+        # TODO: fix
+        #remove long help (adds no value)
+        #allkeys = self.getkeys(cfg=cfgcopy)
+        #for key in allkeys:
+        #    self.set(*key, "...", cfg=cfgcopy, field='help')
+
+        return cfgcopy
+
+    ###########################################################################
+    def _record_manifest(self, filepath, written, digest=None):
+        '''
+        Internal function that records the options write_manifest() wrote
+        filepath with, a snapshot of the configuration it wrote, and the
+        file size and modification time. With digest given, these are also
+        stored along with the digest in filepath.digest, for other chips.
+        '''
+
+        stat = os.stat(filepath)
+        self._written[filepath] = (written, _copy_cfg(self.cfg), stat.st_size, stat.st_mtime_ns)
+        if digest is not None:
+            with open(filepath + '.digest', 'w') as f:
+                json.dump({'digest': digest,
+                           'options': list(written),
+                           'size': stat.st_size,
+                           'mtime': stat.st_mtime_ns}, f)
+
+    ###########################################################################
+    def _unchanged_manifest(self, filepath, written, digest=None):
+        '''
+        Internal function that returns True if filepath holds the manifest
+        written with the options written, unmodified since, and the
+        configuration didn't change since it was written.
+
+        Without digest, this checks the snapshot of the configuration
+        recorded by this chip. The snapshot shares the parameters the
+        configuration didn't change since (see _copy_cfg()), which
+        _delta_cfg() skips without comparing them, so this is much cheaper
+        than digesting the manifest. With digest, the digest of the
+        manifest to write, this checks filepath.digest, which works for
+        files written by other chips and processes.
+        '''
+
+        if written[2] and not os.path.isfile(filepath + '.idx'):
+            return False
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+
+        if digest is None:
+            record = self._written.get(filepath)
+            return (record is not None and record[0] == written and
+                    (stat.st_size, stat.st_mtime_ns) == record[2:] and
+                    not _delta_cfg(self.cfg, record[1]))
+
+        try:
+            with open(filepath + '.digest', 'r') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return stored == {'digest': digest,
+                          'options': list(written),
+                          'size': stat.st_size,
+                          'mtime': stat.st_mtime_ns}
 
     ###########################################################################
     def check_checklist(self, standard, item=None):
@@ -2120,16 +3040,16 @@ class Chip:
         '''
         paths = []
 
-        copyall = self.get('copyall')
-        allkeys = self.getkeys()
-        for key in allkeys:
-            leaftype = self.get(*key, field='type')
-            if re.search('file', leaftype):
-                copy = self.get(*key, field='copy')
-                value = self.get(*key)
-                if copyall or copy:
-                    for item in value:
-                        paths.append(item)
+        if self.get('copyall'):
+            filekeys = self._paramindex('type', 'file')
+        else:
+            copykeys = set(self._paramindex('copy', True))
+            filekeys = [key for key in self._paramindex('type', 'file')
+                        if key in copykeys]
+        for key in filekeys:
+            value = self.get(*key)
+            for item in value:
+                paths.append(item)
 
         return paths
 
@@ -2181,7 +3101,7 @@ class Chip:
             else:
                 outputs = []
             design = self.get('design')
-            ignore = outputs + [f'{design}.pkg.json']
+            ignore = outputs + [f'{design}.pkg.json', f'{design}.pkg.msgpack']
             utils.copytree(indir, outdir, dirs_exist_ok=True, link=True, ignore=ignore)
         elif tool != 'join':
             self.error = 1
@@ -2224,6 +3144,10 @@ class Chip:
             archive_name = f"{design}_{jobname}.tgz"
 
         with tarfile.open(archive_name, "w:gz") as tar:
+            # base manifests of the delta manifests in outputs
+            jobdir = os.path.join(buildpath, design, jobname)
+            for basefile in sorted(glob.glob(os.path.join(jobdir, f"{design}.base*.pkg.*"))):
+                tar.add(os.path.abspath(basefile), arcname=basefile)
             for step in steplist:
                 if index:
                     indexlist = [index]
@@ -2934,27 +3858,474 @@ class Chip:
         return None
 
     ###########################################################################
-    def _runtask_safe(self, step, index, active, error):
+    def _runtask_safe(self, step, index, active, error, pipe):
         try:
-            self._init_logger(step, index)
-        except:
-            traceback.print_exc()
-            print(f"Uncaught exception while initializing logger for step {step}")
-            self.error = 1
-            self._haltstep(step, index, active, log=False)
+            try:
+                self._init_logger(step, index)
+            except:
+                traceback.print_exc()
+                print(f"Uncaught exception while initializing logger for step {step}")
+                self.error = 1
+                self._haltstep(step, index, active, log=False)
+
+            try:
+                self._runtask(step, index, active, error)
+            except SystemExit:
+                # calling sys.exit() in _haltstep triggers a "SystemExit"
+                # exception, but we can ignore these -- if we call sys.exit(), we've
+                # already handled the error.
+                pass
+            except:
+                traceback.print_exc()
+                self.logger.error(f"Uncaught exception while running step {step}.")
+                self.error = 1
+                self._haltstep(step, index, active)
+        finally:
+            # report the task's error bit back to _run_tasks()
+            pipe.send(error[step + str(index)])
+            pipe.close()
+
+    ###########################################################################
+    def _run_tasks(self, tasks, active, error):
+        '''
+        Internal function that runs each (step, index) task of tasks in its
+        own process, once all of its inputs are done, and returns when all
+        tasks are done.
+
+        A task's inputs are done when their active bit is 0. Tasks send
+        their error bit back over a pipe when they finish, the scheduler
+        waits on these pipes instead of polling. The active and error dicts
+        are updated as tasks finish, tasks are given a copy of them.
+
+        Tasks only start while the threads and memory they need (see
+        _task_resources()) fit in the 'maxthreads' and 'maxmemory' budgets
+        along with the running tasks. Ready tasks are tried in order, a
+        task that doesn't fit waits while later ones use the spare
+        capacity. Needs are capped at the budgets, so a task asking for
+        more than the budget runs alone.
+
+        With 'incremental' set, a ready task whose fingerprint matches the
+        one recorded in its work directory is done without running. The
+        fingerprint combines _fingerprint_task() with the fingerprints
+        recorded by the task's inputs. With 'cachedir' set, a ready task
+        whose fingerprint is in the task cache is restored from it instead
+        of running, see _cache_restore().
+        '''
+
+        maxthreads = self.get('maxthreads') or os.cpu_count() or 1
+        maxmemory = self.get('maxmemory') or utils.total_memory() or float('inf')
+
+        inputs = {}
+        needs = {}
+        for step, index in tasks:
+            inputs[step, index] = [in_step + in_index for in_step, in_index in
+                                   self.get('flowgraph', step, index, 'input')]
+            task_threads, task_memory = self._task_resources(step, index)
+            needs[step, index] = (min(task_threads, maxthreads), min(task_memory, maxmemory))
+
+        # static fingerprint, work directories of the task and its inputs
+        # and output manifest of the task
+        incremental = {}
+        reuse = self.get('incremental')
+        cachedir = self._cache_dir()
+        if reuse or cachedir:
+            for step, index in tasks:
+                job = self._inputjob(step, index)
+                indirs = [self._getworkdir(jobname=job, step=in_step, index=in_index)
+                          for in_step, in_index in self.get('flowgraph', step, index, 'input')]
+                workdir = self._getworkdir(step=step, index=index)
+                incremental[step, index] = (self._fingerprint_task(step, index), workdir,
+                                            indirs, self._handoff_manifest(f"{workdir}/outputs"))
+
+        # We have to deinit the chip's logger before spawning the processes
+        # since the logger object is not serializable. _runtask_safe will
+        # reinitialize the logger in each new process, and we reinitialize
+        # the primary chip's logger after the processes complete.
+        self._deinit_logger()
+
+        pending = list(tasks)
+        running = {}
+        threads = 0
+        memory = 0
+        while pending or running:
+            # Start the tasks whose inputs are done, in order, while they fit.
+            # Reused tasks are done right away, which can make others ready.
+            reused = True
+            while reused:
+                reused = False
+                for step, index in list(pending):
+                    if any(active.get(stepstr, 0) for stepstr in inputs[step, index]):
+                        continue
+                    if (step, index) in incremental:
+                        static, workdir, indirs, manifest = incremental[step, index]
+                        fingerprint = self._combine_fingerprint(static, indirs)
+                        self._fingerprints[step, index] = fingerprint
+                        if fingerprint and (
+                                (reuse and os.path.isfile(manifest) and
+                                 fingerprint == self._stored_fingerprint(workdir)) or
+                                (cachedir and
+                                 self._cache_restore(cachedir, fingerprint, workdir))):
+                            pending.remove((step, index))
+                            self._reused.add((step, index))
+                            error[step + index] = 0
+                            active[step + index] = 0
+                            reused = True
+                            continue
+                    task_threads, task_memory = needs[step, index]
+                    if running and (threads + task_threads > maxthreads or
+                                    memory + task_memory > maxmemory):
+                        continue
+                    pending.remove((step, index))
+                    reader, writer = multiprocessing.Pipe(duplex=False)
+                    proc = multiprocessing.Process(target=self._runtask_safe,
+                                                   args=(step, index, active, error, writer))
+                    proc.start()
+                    writer.close()
+                    running[reader] = (step, index, proc)
+                    threads += task_threads
+                    memory += task_memory
+
+            if not running:
+                # the remaining tasks wait on each other (cyclic flowgraph)
+                for step, index in pending:
+                    error[step + index] = 1
+                break
+
+            # Wait for any task to finish
+            for reader in multiprocessing.connection.wait(list(running)):
+                step, index, proc = running.pop(reader)
+                stepstr = step + index
+                task_threads, task_memory = needs[step, index]
+                threads -= task_threads
+                memory -= task_memory
+                try:
+                    error[stepstr] = reader.recv()
+                except EOFError:
+                    # process died without reporting back
+                    error[stepstr] = 1
+                reader.close()
+                proc.join()
+                active[stepstr] = 0
+
+        self._init_logger()
+
+    ###########################################################################
+    def _fingerprint_task(self, step, index):
+        '''
+        Internal function that returns a digest of what the outputs of a
+        task depend on, apart from its inputs: the parameters that apply to
+        it, the contents of the files and directories these name, and the
+        executable and setup module of its tool.
+
+        Results and runtime options, and the flowgraph and eda settings of
+        other tasks, are left out. Parameters are taken from the
+        configuration run() set up for the tasks, without the values tasks
+        of earlier runs set.
+        '''
+
+        # parameters that don't change what tasks produce
+        ignored = ('arg', 'metric', 'record', 'flowstatus', 'steplist', 'indexlist',
+                   'jobname', 'jobincr', 'dir', 'loglevel', 'quiet', 'remote',
+                   'credentials', 'jobscheduler', 'maxthreads', 'maxmemory',
+                   'incremental', 'cachedir', 'cachesize', 'msgevent', 'msgcontact',
+                   'bkpt', 'checkonly', 'track', 'show', 'showtool', 'clean', 'cfg')
+
+        tool = self.get('flowgraph', step, index, 'tool')
+        template = _schema_template()['eda']['default']
+
+        fingerprintcfg = self._fingerprintcfg if self._fingerprintcfg is not None else self.cfg
+        cfg = {}
+        for key, node in fingerprintcfg.items():
+            if key in ignored:
+                continue
+            elif key == 'flowgraph':
+                node = {step: {index: node[step][index]}}
+            elif key == 'eda':
+                # only the tool's own settings, for this step and index
+                tasknode = {}
+                for param, paramnode in node.get(tool, {}).items():
+                    stepped = template.get(param, {}).get('default', {})
+                    if 'defvalue' in paramnode or 'defvalue' in stepped:
+                        tasknode[param] = paramnode
+                    elif index in paramnode.get(step, {}):
+                        tasknode[param] = {step: {index: paramnode[step][index]}}
+                node = {tool: tasknode}
+            cfg[key] = node
+
+        # values only, and the hashes of the files and directories named
+        values = {}
+        files = {}
+        stack = [((key,), node) for key, node in cfg.items()]
+        while stack:
+            keypath, node = stack.pop()
+            if 'defvalue' not in node:
+                stack.extend((keypath + (key,), child) for key, child in node.items()
+                             if key != 'default')
+                continue
+            value = node['value'] if 'value' in node else node['defvalue']
+            if value in (None, []):
+                continue
+            keypathstr = ','.join(keypath)
+            values[keypathstr] = _encode_value(value)
+            sctype = node['type']
+            if 'file' in sctype or 'dir' in sctype:
+                paths = self.find_files(*keypath, cfg=fingerprintcfg, missing_ok=True)
+                if not isinstance(paths, list):
+                    paths = [paths]
+                files[keypathstr] = [self._hash_path(path) for path in paths]
+
+        toolfiles = []
+        if tool not in self.builtin:
+            module = self._find_sc_file(f"tools/{tool}/{tool}.py", missing_ok=True)
+            toolfiles.append(self._hash_path(module))
+            if self.valid('eda', tool, 'exe', quiet=True) and self.get('eda', tool, 'exe'):
+                # the installed executable changes with its version
+                exe = shutil.which(self.get('eda', tool, 'exe'))
+                if exe:
+                    stat = os.stat(exe)
+                    toolfiles.append(f'{exe}:{stat.st_size}:{stat.st_mtime_ns}')
+
+        text = json.dumps([values, files, toolfiles], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    ###########################################################################
+    def _hash_path(self, path):
+        '''
+        Internal function that returns the sha256 hex digest of a file, or
+        of the names and contents of the files in a directory, and None for
+        missing paths. Hashes are memoized by path, size and modification
+        time.
+        '''
+
+        if path is None or not os.path.exists(path):
+            return None
+
+        if os.path.isdir(path):
+            hashobj = hashlib.sha256()
+            for root, dirs, filenames in os.walk(path):
+                dirs.sort()
+                for filename in sorted(filenames):
+                    filepath = os.path.join(root, filename)
+                    hashobj.update(os.path.relpath(filepath, path).encode())
+                    hashobj.update(str(self._hash_path(filepath)).encode())
+            return hashobj.hexdigest()
+
+        stat = os.stat(path)
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        if key not in self._filehashes:
+            hashobj = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    hashobj.update(block)
+            self._filehashes[key] = hashobj.hexdigest()
+        return self._filehashes[key]
+
+    ###########################################################################
+    def _combine_fingerprint(self, static, indirs):
+        '''
+        Internal function that returns the fingerprint of a task from its
+        _fingerprint_task() digest and the fingerprints recorded in the
+        work directories of its inputs, None if one of these is missing.
+        '''
+
+        fingerprints = [static]
+        for indir in indirs:
+            fingerprint = self._stored_fingerprint(indir)
+            if fingerprint is None:
+                return None
+            fingerprints.append(fingerprint)
+        return hashlib.sha256('\n'.join(fingerprints).encode()).hexdigest()
+
+    ###########################################################################
+    def _stored_fingerprint(self, workdir):
+        '''
+        Internal function that returns the fingerprint recorded by the last
+        successful run of the task in workdir, if any.
+        '''
 
         try:
-            self._runtask(step, index, active, error)
-        except SystemExit:
-            # calling sys.exit() in _haltstep triggers a "SystemExit"
-            # exception, but we can ignore these -- if we call sys.exit(), we've
-            # already handled the error.
-            pass
-        except:
-            traceback.print_exc()
-            self.logger.error(f"Uncaught exception while running step {step}.")
-            self.error = 1
-            self._haltstep(step, index, active)
+            with open(os.path.join(workdir, 'sc_fingerprint')) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    ###########################################################################
+    def _cache_dir(self):
+        '''
+        Internal function that returns the absolute path of the task cache,
+        None if 'cachedir' is not set.
+        '''
+
+        if not self.get('cachedir'):
+            return None
+        return os.path.join(self.cwd, self._resolve_env_vars(self.get('cachedir')))
+
+    ###########################################################################
+    def _cache_entry(self, cachedir, fingerprint):
+        '''
+        Internal function that returns the directory holding the results
+        of the task with fingerprint in the task cache.
+        '''
+
+        return os.path.join(cachedir, fingerprint[:2], fingerprint)
+
+    ###########################################################################
+    def _cache_store(self, cachedir, fingerprint):
+        '''
+        Internal function that copies the outputs and reports of the task
+        run in the current directory into the task cache under its
+        fingerprint, then removes the least recently used results until the
+        cache fits in 'cachesize'.
+
+        The output manifest is stored in full, since delta manifests only
+        make sense next to the base manifest of their job. Entries are
+        assembled in a temporary directory and renamed into place, so
+        readers never see a partial entry.
+        '''
+
+        entry = self._cache_entry(cachedir, fingerprint)
+        if os.path.isdir(entry):
+            return
+
+        tmpdir = f"{entry}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(tmpdir)
+            for name in ('outputs', 'reports'):
+                if os.path.isdir(name):
+                    utils.copytree(name, os.path.join(tmpdir, name))
+            manifest = self._handoff_manifest(os.path.join(tmpdir, 'outputs'), write=True)
+            for path in (manifest, self._handoff_manifest(os.path.join(tmpdir, 'outputs'))):
+                if os.path.isfile(path):
+                    os.remove(path)
+            self.write_manifest(manifest, compact=True)
+
+            size = 0
+            for root, dirs, filenames in os.walk(tmpdir):
+                for filename in filenames:
+                    size += os.path.getsize(os.path.join(root, filename))
+            with open(os.path.join(tmpdir, 'sc_cache.json'), 'w') as f:
+                json.dump({'size': size}, f)
+
+            os.rename(tmpdir, entry)
+        except OSError as e:
+            # another job stored the same task first, or the cache is unusable
+            self.logger.debug(f"Task result not cached: {e}")
+            shutil.rmtree(tmpdir, ignore_errors=True)
+            return
+
+        if self.get('cachesize') is not None:
+            self._cache_evict(cachedir, self.get('cachesize'))
+
+    ###########################################################################
+    def _cache_evict(self, cachedir, maxsize):
+        '''
+        Internal function that removes the least recently used entries of
+        the task cache until the sizes of the remaining ones add up to at
+        most maxsize bytes. Entries are renamed before being removed, so
+        they disappear at once for jobs restoring from the cache.
+        '''
+
+        entries = []
+        total = 0
+        for entry in glob.glob(os.path.join(cachedir, '??', '*')):
+            if entry.endswith('.tmp'):
+                continue
+            try:
+                with open(os.path.join(entry, 'sc_cache.json')) as f:
+                    size = json.load(f)['size']
+                entries.append((os.stat(entry).st_mtime, size, entry))
+            except (OSError, ValueError, KeyError):
+                continue
+            total += size
+
+        for mtime, size, entry in sorted(entries):
+            if total <= maxsize:
+                break
+            tmpdir = f"{entry}.{os.getpid()}.tmp"
+            try:
+                os.rename(entry, tmpdir)
+            except OSError:
+                # evicted by another job
+                continue
+            shutil.rmtree(tmpdir, ignore_errors=True)
+            total -= size
+
+    ###########################################################################
+    def _cache_restore(self, cachedir, fingerprint, workdir):
+        '''
+        Internal function that restores the results of the task with
+        fingerprint from the task cache into workdir, and returns True if
+        there were results to restore.
+
+        Files are hard linked from the cache, and copied where the cache
+        is on another file system. Restoring marks the entry as recently
+        used.
+        '''
+
+        entry = self._cache_entry(cachedir, fingerprint)
+        if not os.path.isdir(entry):
+            return False
+
+        try:
+            if os.path.isdir(workdir):
+                shutil.rmtree(workdir)
+            os.makedirs(workdir)
+            for name in ('outputs', 'reports'):
+                src = os.path.join(entry, name)
+                dst = os.path.join(workdir, name)
+                if not os.path.isdir(src):
+                    continue
+                try:
+                    utils.copytree(src, dst, link=True)
+                except OSError:
+                    shutil.rmtree(dst, ignore_errors=True)
+                    utils.copytree(src, dst)
+            with open(os.path.join(workdir, 'sc_fingerprint'), 'w') as f:
+                f.write(fingerprint)
+            os.utime(entry)
+        except OSError:
+            # the entry was evicted while restoring it
+            shutil.rmtree(workdir, ignore_errors=True)
+            return False
+
+        return True
+
+    ###########################################################################
+    def _inputjob(self, step, index):
+        '''
+        Internal function that returns the job a task reads its inputs
+        from, see 'jobinput'.
+        '''
+
+        job = self.get('jobname')
+        if job in self.getkeys('jobinput'):
+            if step in self.getkeys('jobinput',job):
+                if index in self.getkeys('jobinput',job,step):
+                    job = self.get('jobinput', job, step, index)
+        return job
+
+    ###########################################################################
+    def _task_resources(self, step, index):
+        '''
+        Internal function that returns the (threads, memory) a task needs
+        on this host, from its tool's 'threads' and 'memory' settings.
+        Builtins need one thread, tasks deferred to a job scheduler nothing.
+        '''
+
+        tool = self.get('flowgraph', step, index, 'tool')
+        if tool in self.builtin:
+            return (1, 0)
+        if self.get('jobscheduler') and self.get('flowgraph', step, index, 'input'):
+            # see _runtask(), the task waits on the compute node
+            return (0, 0)
+
+        threads = 1
+        if self.valid('eda', tool, 'threads', step, index, quiet=True):
+            threads = self.get('eda', tool, 'threads', step, index) or 1
+        memory = 0
+        if self.valid('eda', tool, 'memory', step, index, quiet=True):
+            memory = self.get('eda', tool, 'memory', step, index) or 0
+        return (threads, memory)
 
     ###########################################################################
     def _runtask(self, step, index, active, error):
@@ -2962,10 +4333,10 @@ class Chip:
         Private per step run method called by run().
         The method takes in a step string and index string to indicated what
         to run. Execution state coordinated through the active/error
-        multiprocessing Manager dicts.
+        dicts, the task's copies of those kept by _run_tasks().
 
         Execution flow:
-        T1. Wait in loop until all previous steps/indexes have completed
+        T1. Started by _run_tasks() once all previous steps/indexes have completed
         T2. Defer job to compute node if using job scheduler
         T3. Start task timer
         T4. Set up working directory + chdir
@@ -3000,20 +4371,6 @@ class Chip:
         design = self.get('design')
         tool = self.get('flowgraph', step, index, 'tool')
 
-        ##################
-        # 1. Wait loop
-        self.logger.info('Waiting for inputs...')
-        while True:
-            # Checking that there are no pending jobs
-            pending = 0
-            for in_step, in_index in self.get('flowgraph', step, index, 'input'):
-                pending = pending + active[in_step + in_index]
-            # beak out of loop when no all inputs are done
-            if not pending:
-                break
-            # Short sleep
-            time.sleep(0.1)
-
         ##################
         # 2. Defer job to compute node
         # If the job is configured to run on a cluster, collect the schema
@@ -3035,11 +4392,7 @@ class Chip:
         # 4. Directory setup
 
         # support for sharing data across jobs
-        job = self.get('jobname')
-        if job in self.getkeys('jobinput'):
-            if step in self.getkeys('jobinput',job):
-                if index in self.getkeys('jobinput',job,step):
-                    job = self.get('jobinput', job, step, index)
+        job = self._inputjob(step, index)
 
         workdir = self._getworkdir(step=step,index=index)
         cwd = os.getcwd()
@@ -3056,12 +4409,14 @@ class Chip:
 
         all_inputs = []
         if not self.get('remote'):
+            cfgfiles = []
             for in_step, in_index in self.get('flowgraph', step, index, 'input'):
                 index_error = error[in_step + in_index]
                 self.set('flowstatus', in_step, in_index, 'error', index_error)
                 if not index_error:
-                    cfgfile = f"../../../{job}/{in_step}/{in_index}/outputs/{design}.pkg.json"
-                    self.read_manifest(cfgfile, clobber=False)
+                    cfgfile = self._handoff_manifest(f"../../../{job}/{in_step}/{in_index}/outputs")
+                    cfgfiles.append(cfgfile)
+            self._read_inputs(cfgfiles)
 
         ##################
         # 6. Write configuration prior to step running into inputs
@@ -3131,7 +4486,8 @@ class Chip:
             # Skip copying pkg.json files here, since we write the current chip
             # configuration into inputs/{design}.pkg.json earlier in _runstep.
             utils.copytree(f"../../../{job}/{in_step}/{in_index}/outputs", 'inputs/', dirs_exist_ok=True,
-                ignore=[f'{design}.pkg.json'], link=True)
+                ignore=[f'{design}.pkg.json', f'{design}.pkg.msgpack',
+                        f'{design}.pkg.json.digest', f'{design}.pkg.msgpack.digest'], link=True)
 
         ##################
         # 10. Copy Reference Scripts
@@ -3197,7 +4553,8 @@ class Chip:
         # 15. Interface with tools (Don't move this!)
         suffix = self.get('eda', tool, 'format')
         if suffix:
-            self.write_manifest(f"sc_manifest.{suffix}", abspath=True)
+            keypaths = [item.split(',') for item in self.get('eda', tool, 'manifest')]
+            self.write_manifest(f"sc_manifest.{suffix}", abspath=True, keypaths=keypaths)
 
         ##################
         # 16. Run executable (or copy inputs to outputs for builtin functions)
@@ -3281,7 +4638,19 @@ class Chip:
         self.set('arg', 'step', None, clobber=True)
         self.set('arg', 'index', None, clobber=True)
 
-        self.write_manifest("outputs/" + self.get('design') +'.pkg.json')
+        manifest = self._handoff_manifest('outputs', write=True)
+        if self._deltabase is not None:
+            self._write_delta(manifest)
+        else:
+            self.write_manifest(manifest, compact=True)
+
+        # lets later incremental runs reuse the outputs, see _run_tasks()
+        fingerprint = self._fingerprints.get((step, index))
+        if fingerprint:
+            with open('sc_fingerprint', 'w') as f:
+                f.write(fingerprint)
+            if self.get('cachedir'):
+                self._cache_store(self._cache_dir(), fingerprint)
 
         ##################
         # 22. Clean up non-essential files
@@ -3320,11 +4689,11 @@ class Chip:
         check_manifest() function and files in the manifest are hashed based
         on the 'hashmode' schema setting.
 
-        Once launched, each process waits for preceding steps to complete,
-        as defined by the flowgraph 'inputs' parameter. Once a all inputs
-        are ready, previous steps are checked for errors before the
-        process entered a local working directory and starts to run
-        a tool or to execute a built in Chip function.
+        Each step/index process is launched once the preceding steps
+        have completed, as defined by the flowgraph 'inputs' parameter.
+        Previous steps are checked for errors before the process enters
+        a local working directory and starts to run a tool or to execute
+        a built in Chip function.
 
         Fatal errors within a step/index process cause all subsequent
         processes to exit before start, returning control to the the main
@@ -3344,10 +4713,11 @@ class Chip:
             steplist = self.list_steps()
 
             # If no step(list) was specified, the whole flow is being run
-            # start-to-finish. Delete the build dir to clear stale results.
+            # start-to-finish. Delete the build dir to clear stale results,
+            # unless these may be reused.
             cur_job_dir = f'{self.get("dir")}/{self.get("design")}/'\
                           f'{self.get("jobname")}'
-            if os.path.isdir(cur_job_dir):
+            if os.path.isdir(cur_job_dir) and not self.get('incremental'):
                 shutil.rmtree(cur_job_dir)
 
         # Set env variables
@@ -3356,6 +4726,7 @@ class Chip:
             os.environ[envvar] = val
 
         # Remote workflow: Dispatch the Chip to a remote server for processing.
+        self._reused = set()
         if self.get('remote'):
             # Load the remote storage config into the status dictionary.
             if self.get('credentials'):
@@ -3387,13 +4758,11 @@ class Chip:
             # Fetch results (and delete the job's data from the server).
             fetch_results(self)
         else:
-            manager = multiprocessing.Manager()
-            error = manager.dict()
-            active = manager.dict()
+            error = {}
+            active = {}
 
-            # Launch a thread for eact step in flowgraph
-            # Use a shared even for errors
-            # Use a manager.dict for keeping track of active processes
+            # Tasks are launched by _run_tasks() as their inputs finish and
+            # report back over pipes, keeping track of active processes
             # (one unqiue dict entry per process),
             # Set up tools and processes
             for step in self.getkeys('flowgraph'):
@@ -3455,32 +4824,35 @@ class Chip:
                 self.logger.info("Exiting after static check(), checkonly=True")
                 sys.exit()
 
-            # Create all processes
-            processes = []
+            # Task output manifests are written as deltas against this base.
+            jobdir = self._getworkdir()
+            os.makedirs(jobdir, exist_ok=True)
+            self._deltabase = self._write_base(jobdir)
+            self._deltacfg = _copy_cfg(self.cfg)
+
+            # Values tasks set in earlier runs, merged back into the chip,
+            # don't change fingerprints: only the parameters changed since
+            # the last read back apply on top of the last fingerprinted
+            # configuration.
+            if self._resultcfg is None:
+                self._fingerprintcfg = self._deltacfg
+            else:
+                changed = _delta_cfg(self.cfg, self._resultcfg)
+                # a structural copy, _overlay_cfg() writes into its branches
+                self._fingerprintcfg = _overlay_cfg(_copy_cfg(self._fingerprintcfg), changed)
+
+            # List all tasks
+            tasks = []
             for step in steplist:
                 if self.get('arg', 'index'):
                     indexlist = [self.get('arg', 'index')]
                 else:
                     indexlist = self.getkeys('flowgraph', step)
                 for index in indexlist:
-                    processes.append(multiprocessing.Process(target=self._runtask_safe,
-                                                             args=(step, index, active, error,)))
-
+                    tasks.append((step, index))
 
-            # We have to deinit the chip's logger before spawning the processes
-            # since the logger object is not serializable. _runtask_safe will
-            # reinitialize the logger in each new process, and we reinitialize
-            # the primary chip's logger after the processes complete.
-            self._deinit_logger()
-
-            # Start all processes
-            for p in processes:
-                p.start()
-            # Mandatory process cleanup
-            for p in processes:
-                p.join()
-
-            self._init_logger()
+            self._run_tasks(tasks, active, error)
+            self._remove_bases(jobdir)
 
             # Make a clean exit if one of the steps failed
             halt = 0
@@ -3507,11 +4879,24 @@ class Chip:
         laststep = steplist[-1]
         lastindex = '0'
         lastdir = self._getworkdir(step=laststep, index=lastindex)
-        lastcfg = f"{lastdir}/outputs/{self.get('design')}.pkg.json"
-        if os.path.isfile(lastcfg):
+        lastcfg = self._handoff_manifest(f"{lastdir}/outputs")
+        if os.path.isfile(lastcfg) and (laststep, lastindex) in self._reused:
+            # the manifest was written by an earlier run, or another job
+            # through the task cache, whose options may differ from this
+            # one's, only the task results carry over
+            lastresults = self.read_manifest(lastcfg, update=False)
+            self.merge_manifest({key: lastresults[key] for key in ('metric', 'record', 'flowstatus')
+                                 if key in lastresults}, clobber=True, clear=True)
+            self._deltabase = None
+            self._deltacfg = None
+            self._resultcfg = _copy_cfg(self.cfg)
+        elif os.path.isfile(lastcfg):
             local_dir = self.get('dir')
             self.read_manifest(lastcfg, clobber=True, clear=True)
             self.set('dir', local_dir)
+            self._deltabase = None
+            self._deltacfg = None
+            self._resultcfg = _copy_cfg(self.cfg)
         else:
             # Hack to find first failed step by checking for presence of output
             # manifests.
@@ -3520,7 +4905,7 @@ class Chip:
                 step_has_cfg = False
                 for index in self.getkeys('flowgraph', step):
                     stepdir = self._getworkdir(step=step, index=lastindex)
-                    cfg = f"{stepdir}/outputs/{self.get('design')}.pkg.json"
+                    cfg = self._handoff_manifest(f"{stepdir}/outputs")
                     if os.path.isfile(cfg):
                         step_has_cfg = True
                         break
@@ -3535,7 +4920,7 @@ class Chip:
             sys.exit(1)
 
         # Store run in history
-        self.cfghistory[self.get('jobname')] = copy.deepcopy(self.cfg)
+        self.cfghistory[self.get('jobname')] = _copy_cfg(self.cfg)
 
     ###########################################################################
     def show(self, filename=None):
@@ -3649,60 +5034,34 @@ class Chip:
         ok = True
         valuetype = type(value)
         errormsg = ""
-        if (not re.match(r'\[',cfg['type'])) & (valuetype==list):
+        desc = _typedesc(cfg['type'])
+        if (not desc.is_list) & (valuetype==list):
             errormsg = "Value must be scalar."
             ok = False
-            # Iterate over list
         else:
             # Create list for iteration
             if valuetype == list:
                 valuelist = value
             else:
                 valuelist = [value]
-                # Make type python compatible
-            cfgtype = re.sub(r'[\[\]]', '', cfg['type'])
             for item in valuelist:
-                valuetype =  type(item)
-                if (cfgtype != valuetype.__name__):
-                    tupletype = re.match(r'\([\w\,]+\)',cfgtype)
-                    #TODO: check tuples!
-                    if tupletype:
-                        pass
-                    elif cfgtype == 'bool':
-                        if not item in ['true', 'false']:
-                            errormsg = "Valid boolean values are True/False/'true'/'false'"
-                            ok = False
-                    elif cfgtype == 'file':
-                        pass
-                    elif cfgtype == 'dir':
-                        pass
-                    elif (cfgtype == 'float'):
-                        try:
-                            float(item)
-                        except:
-                            errormsg = "Type mismatch. Cannot cast item to float."
-                            ok = False
-                    elif (cfgtype == 'int'):
-                        try:
-                            int(item)
-                        except:
-                            errormsg = "Type mismatch. Cannot cast item to int."
-                            ok = False
-                    elif item is not None:
-                        errormsg = "Type mismach."
-                        ok = False
+                msg = desc.check(item)
+                if msg is not None:
+                    errormsg = msg
+                    valuetype = type(item)
+                    ok = False
 
         # Logger message
-        if type(value) == list:
-            printvalue = ','.join(map(str, value))
-        else:
-            printvalue = str(value)
-        errormsg = (errormsg +
-                    " Key=" + str(leafkey) +
-                    ", Expected Type=" + cfg['type'] +
-                    ", Entered Type=" + valuetype.__name__ +
-                    ", Value=" + printvalue)
-
+        if not ok:
+            if type(value) == list:
+                printvalue = ','.join(map(str, value))
+            else:
+                printvalue = str(value)
+            errormsg = (errormsg +
+                        " Key=" + ",".join(leafkey) +
+                        ", Expected Type=" + cfg['type'] +
+                        ", Entered Type=" + valuetype.__name__ +
+                        ", Value=" + printvalue)
 
         return (ok, errormsg)
 
@@ -3903,11 +5262,3 @@ class Chip:
         pathhash = hashlib.md5(pathstr.encode('utf-8')).hexdigest()
 
         return f'{filename}_{pathhash}{ext}'
-
-###############################################################################
-# Package Customization classes
-###############################################################################
-
-class YamlIndentDumper(yaml.Dumper):
-    def increase_indent(self, flow=False, indentless=False):
-        return super(YamlIndentDumper, self).increase_indent(flow, False)
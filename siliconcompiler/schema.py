@@ -5,6 +5,11 @@ import os
 import sys
 import copy
 import json
+import mmap
+import hashlib
+from collections.abc import Mapping, MutableMapping
+
+from siliconcompiler import utils
 
 #############################################################################
 # CHIP CONFIGURATION
@@ -61,6 +66,577 @@ def schema_cfg():
     cfg = schema_metric(cfg)
     cfg = schema_record(cfg)
 
+    # Parse every type string once up front and store native defaults
+    _decode_cfg(cfg)
+
+    return cfg
+
+# Shared result of schema_cfg(), see _schema_template()
+_TEMPLATE = None
+
+def _schema_template():
+    '''Returns the schema shared by all Chip objects, built on first use.
+
+    The template must not be modified. Each Chip works on an _own_cfg() copy
+    of it, whose leaf cells share their static fields (with their help text)
+    with the template.
+    '''
+    global _TEMPLATE
+    if _TEMPLATE is None:
+        _TEMPLATE = _param_cfg(schema_cfg(), cls=_TemplateParameter)
+    return _TEMPLATE
+
+###############################################################################
+# Type descriptors
+###############################################################################
+
+# Leaf cells hold native python values (int, float, bool, tuple). Manifests
+# on disk keep the original string form, see _encode_cfg()/_decode_cfg().
+
+# Characters dropped when parsing a stored tuple string such as "('a', 'b')"
+_TUPLE_STRIP = str.maketrans('', '', "()' ")
+
+# type string -> _TypeDesc, shared by all schema instances
+_TYPES = {}
+
+def _to_int(item):
+    if type(item) is int:
+        return item
+    return int(float(item))
+
+def _to_bool(item):
+    return item is True or item == 'true'
+
+def _to_str(item):
+    if item is None or isinstance(item, str):
+        return item
+    return str(item)
+
+_CASTS = {'int': _to_int, 'float': float, 'bool': _to_bool}
+
+class _TypeDesc:
+    '''Pre-parsed form of a schema 'type' string.
+
+    Attributes:
+        sctype (str): Original type string, eg. '[(float,float)]'.
+        is_list (bool): True for list types ('[...]').
+        kind (str): Element kind: 'str', 'int', 'float', 'bool', 'file',
+            'dir' or 'tuple'.
+        elems (tuple): Element kinds of a tuple type, eg. ('float', 'float').
+        arity (int): Number of tuple elements, 0 for non-tuples.
+        convert (callable): Converts one item (a list element for list
+            types, the value for scalars) to its native python value. Accepts
+            native values as well as their manifest string form.
+        check (callable): Returns an error string if a python item can't be
+            stored in this type, None if it can.
+    '''
+
+    def __init__(self, sctype):
+        self.sctype = sctype
+        self.is_list = sctype.startswith('[')
+        base = sctype.strip('[]')
+        if base.startswith('('):
+            self.kind = 'tuple'
+            self.elems = tuple(base.strip('()').split(','))
+        else:
+            self.kind = base
+            self.elems = ()
+        self.arity = len(self.elems)
+        self.convert = self._make_convert()
+        self.check = self._make_check()
+
+    def __reduce__(self):
+        # the callables can't be pickled, rebuild from the type string
+        return (_typedesc, (self.sctype,))
+
+    def native(self, value):
+        '''Converts a complete parameter value to its native form.'''
+        if value is None:
+            return None
+        elif not self.is_list:
+            if isinstance(value, list):
+                # malformed scalar, leave it for the type checker
+                return value
+            return self.convert(value)
+        elif isinstance(value, list):
+            convert = self.convert
+            return [convert(item) for item in value]
+        else:
+            return [self.convert(value)]
+
+    def _make_convert(self):
+        if self.kind == 'tuple':
+            # scalar tuples have always been read back as floats
+            if self.is_list:
+                casts = tuple(_CASTS.get(e, _to_str) for e in self.elems)
+            else:
+                casts = (float,) * self.arity
+            def convert(item):
+                if isinstance(item, str):
+                    item = item.translate(_TUPLE_STRIP).split(',')
+                return tuple(cast(f) for cast, f in zip(casts, item))
+            return convert
+        return _CASTS.get(self.kind, _to_str)
+
+    def _make_check(self):
+        kind = self.kind
+        if kind in ('tuple', 'file', 'dir'):
+            #TODO: check tuples!
+            return lambda item: None
+        elif kind == 'bool':
+            def check(item):
+                if isinstance(item, bool) or item in ('true', 'false'):
+                    return None
+                return "Valid boolean values are True/False/'true'/'false'"
+            return check
+        elif kind in ('int', 'float'):
+            cast = int if kind == 'int' else float
+            msg = f"Type mismatch. Cannot cast item to {kind}."
+            def check(item):
+                if type(item) is cast:
+                    return None
+                try:
+                    cast(item)
+                except:
+                    return msg
+                return None
+            return check
+        else:
+            def check(item):
+                if item is None or type(item).__name__ == kind:
+                    return None
+                return "Type mismach."
+            return check
+
+def _typedesc(sctype):
+    '''Returns the shared _TypeDesc for a schema type string.'''
+    desc = _TYPES.get(sctype)
+    if desc is None:
+        desc = _TypeDesc(sctype)
+        _TYPES[sctype] = desc
+    return desc
+
+def _encode_item(item):
+    if item is True:
+        return 'true'
+    elif item is False:
+        return 'false'
+    elif item is None or isinstance(item, str):
+        return item
+    elif isinstance(item, float) and item.is_integer():
+        # keep whole numbers as they are usually entered, eg. '10' not '10.0'
+        return str(int(item))
+    elif isinstance(item, tuple):
+        fields = [repr(f) if isinstance(f, str) else _encode_item(f)
+                  for f in item]
+        return '(' + ', '.join(fields) + ')'
+    return str(item)
+
+def _encode_value(value):
+    '''Returns the manifest (string) form of a native parameter value.'''
+    if isinstance(value, list):
+        return [_encode_item(item) for item in value]
+    return _encode_item(value)
+
+###############################################################################
+# Parameters
+###############################################################################
+
+# Leaf cell fields that change per parameter instance, and the _Parameter
+# slot holding each. All other fields (switch, type, require, defvalue, help,
+# ...) belong to the definition.
+_PARAM_SLOTS = {field: '_' + field for field in ('value', 'lock', 'copy',
+                                                 'filehash', 'date', 'author',
+                                                 'signature')}
+
+# Marks an empty _Parameter slot
+_UNSET = object()
+
+class _ParamDef:
+    '''Static part of a schema parameter, shared by every instance of its
+    definition (eg. all steps and indices of a flowgraph parameter).
+
+    Attributes:
+        fields (dict): Static fields of the parameter.
+        desc (_TypeDesc): Type descriptor for fields['type'].
+    '''
+
+    __slots__ = ('fields', 'desc')
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.desc = _typedesc(fields['type'])
+
+    def __reduce__(self):
+        return (_ParamDef, (self.fields,))
+
+class _Parameter(MutableMapping):
+    '''Compact schema leaf cell.
+
+    Per-instance fields live in slots, static fields are read from the shared
+    _ParamDef. The class behaves like the leaf cell dict it replaces, so code
+    and tool scripts indexing leaf['value'] or testing 'defvalue' in node work
+    unchanged. Writing a static field gives the parameter its own _ParamDef.
+    '''
+
+    __slots__ = ('_def',) + tuple(_PARAM_SLOTS.values())
+
+    def __init__(self, definition, fields=None):
+        self._def = definition
+        # unset slots hold _UNSET so they can be read without exceptions
+        self._value = self._lock = self._copy = _UNSET
+        self._filehash = self._date = self._author = self._signature = _UNSET
+        if fields:
+            for field, value in fields.items():
+                setattr(self, _PARAM_SLOTS[field], value)
+
+    def __reduce__(self):
+        fields = {field: getattr(self, slot) for field, slot in _PARAM_SLOTS.items()
+                  if getattr(self, slot) is not _UNSET}
+        return (_Parameter, (self._def, fields))
+
+    def __getitem__(self, field):
+        slot = _PARAM_SLOTS.get(field)
+        if slot is None:
+            return self._def.fields[field]
+        value = getattr(self, slot)
+        if value is _UNSET:
+            raise KeyError(field)
+        return value
+
+    def __setitem__(self, field, value):
+        slot = _PARAM_SLOTS.get(field)
+        if slot is None:
+            self._def = _ParamDef({**self._def.fields, field: value})
+        else:
+            setattr(self, slot, value)
+
+    def __delitem__(self, field):
+        slot = _PARAM_SLOTS.get(field)
+        if slot is None:
+            fields = dict(self._def.fields)
+            del fields[field]
+            self._def = _ParamDef(fields)
+        elif getattr(self, slot) is _UNSET:
+            raise KeyError(field)
+        else:
+            setattr(self, slot, _UNSET)
+
+    def __contains__(self, field):
+        slot = _PARAM_SLOTS.get(field)
+        if slot is None:
+            return field in self._def.fields
+        return getattr(self, slot) is not _UNSET
+
+    def __iter__(self):
+        yield from self._def.fields
+        for field, slot in _PARAM_SLOTS.items():
+            if getattr(self, slot) is not _UNSET:
+                yield field
+
+    def __len__(self):
+        return len(self._def.fields) + sum(getattr(self, slot) is not _UNSET
+                                           for slot in _PARAM_SLOTS.values())
+
+    def __repr__(self):
+        return f'_Parameter({dict(self)!r})'
+
+    def items(self):
+        return self.todict().items()
+
+    def todict(self):
+        '''Returns all fields as a plain leaf cell dict.'''
+        fields = dict(self._def.fields)
+        for field, slot in _PARAM_SLOTS.items():
+            value = getattr(self, slot)
+            if value is not _UNSET:
+                fields[field] = value
+        return fields
+
+    def copy(self):
+        '''Returns a copy sharing the definition and field values.'''
+        # plain slot assignments, this is on the path of every set()
+        param = _Parameter.__new__(_Parameter)
+        param._def = self._def
+        param._value = self._value
+        param._lock = self._lock
+        param._copy = self._copy
+        param._filehash = self._filehash
+        param._date = self._date
+        param._author = self._author
+        param._signature = self._signature
+        return param
+
+class _TemplateParameter(_Parameter):
+    '''Leaf cell of the schema template, which refuses writes. Chips work on
+    copies of these (see _own_cfg()), which are plain _Parameters.'''
+
+    __slots__ = ()
+
+    def __setitem__(self, field, value):
+        raise TypeError('schema template parameters are read-only, '
+                        'write to a Chip configuration instead')
+
+    def __delitem__(self, field):
+        raise TypeError('schema template parameters are read-only, '
+                        'write to a Chip configuration instead')
+
+def _param_cfg(cfg, cls=_Parameter):
+    '''Returns a copy of cfg with every leaf cell dict replaced by a
+    _Parameter, or by an instance of the given _Parameter subclass. Leaf
+    cells that are equal copies of each other (eg. from copy.deepcopy() in
+    the schema builders) share one _ParamDef.'''
+    defs = {}
+    def convert(node):
+        if 'defvalue' not in node:
+            return {k: convert(v) for k, v in node.items()}
+        static = {k: v for k, v in node.items() if k not in _PARAM_SLOTS}
+        fields = {k: v for k, v in node.items() if k in _PARAM_SLOTS}
+        key = repr(static)
+        if key not in defs:
+            defs[key] = _ParamDef(static)
+        return cls(defs[key], fields)
+    return convert(cfg)
+
+def _own_cfg(cfg):
+    '''Returns a copy of cfg with its own branches and leaf cells, for use
+    as a Chip configuration.
+
+    Leaf cells are copied with _Parameter.copy(), which shares the static
+    fields, so writing to a leaf of the copy in place, as in
+    chip.cfg['asic']['diearea']['value'] = ..., never reaches cfg.
+    '''
+    if 'defvalue' in cfg:
+        return cfg.copy() if isinstance(cfg, _Parameter) else dict(cfg)
+    return {k: _own_cfg(v) for k, v in cfg.items()}
+
+def _copy_cfg(cfg):
+    '''Returns a structural copy of cfg.
+
+    Branches are copied and leaf cells are shared with cfg. Chip never
+    modifies a leaf cell in place, it replaces the cell on write, so writes
+    to either copy are not seen by the other.
+    '''
+    if 'defvalue' in cfg:
+        return cfg
+    return {k: _copy_cfg(v) for k, v in cfg.items()}
+
+def _plain_cfg(cfg):
+    '''Returns a deep copy of cfg that shares nothing with it, with leaf
+    cells as plain dicts.'''
+    if 'defvalue' in cfg:
+        leaf = cfg.todict() if isinstance(cfg, _Parameter) else cfg
+        return copy.deepcopy(dict(leaf))
+    return {k: _plain_cfg(v) for k, v in cfg.items()}
+
+def _delta_cfg(cfg, base):
+    '''Returns a sparse copy of cfg holding only the leaf cells that differ
+    from base, as plain dicts without help and example.
+
+    Leaf cells shared with base (see _copy_cfg()) are skipped without being
+    compared. Parameters that don't exist in base are left out while empty.
+    '''
+    delta = {}
+    for k, node in cfg.items():
+        basenode = base.get(k) if base is not None else None
+        if node is basenode:
+            continue
+        elif 'defvalue' in node:
+            leaf = node.todict() if isinstance(node, _Parameter) else dict(node)
+            if basenode is None:
+                empty = (None, 'null', [])
+                if leaf['defvalue'] in empty and leaf.get('value') in empty:
+                    continue
+            elif isinstance(basenode, _Parameter):
+                if basenode.todict() == leaf:
+                    continue
+            elif basenode == leaf:
+                continue
+            leaf.pop('help', None)
+            leaf.pop('example', None)
+            delta[k] = leaf
+        else:
+            subdelta = _delta_cfg(node, basenode)
+            if subdelta:
+                delta[k] = subdelta
+    return delta
+
+def _overlay_cfg(cfg, delta):
+    '''Replaces the leaf cells of cfg with those found in delta, in place,
+    adding missing branches. Missing branches at a 'default' level of cfg
+    start out as a copy of its template.'''
+    for k, node in delta.items():
+        if k not in cfg and 'default' in cfg and 'defvalue' not in node:
+            cfg[k] = _overlay_cfg(_copy_cfg(cfg['default']), node)
+        elif 'defvalue' in node or k not in cfg or 'defvalue' in cfg[k]:
+            cfg[k] = node
+        else:
+            _overlay_cfg(cfg[k], node)
+    return cfg
+
+def _empty_value(value):
+    '''Returns True for values that a merge with clobber=False replaces.'''
+    return value is False or value in (None, 'null', [], 'false')
+
+def _reduce_cfg(cfg, other):
+    '''Returns the manifest that has the effect of merging cfg and then
+    other with clobber=False: each parameter gets the first non-empty
+    value and the other fields of the last manifest, unless cfg locks it.
+    Neither argument is modified, unchanged nodes are shared.'''
+    reduced = dict(cfg)
+    for k, node in other.items():
+        mine = cfg.get(k)
+        if mine is None:
+            reduced[k] = node
+        elif 'defvalue' not in mine and 'defvalue' not in node:
+            reduced[k] = _reduce_cfg(mine, node)
+        elif 'defvalue' in mine and 'defvalue' in node and mine.get('lock') not in (True, 'true'):
+            leaf = dict(mine)
+            leaf.update(node)
+            value = mine['value'] if 'value' in mine else mine['defvalue']
+            if not _empty_value(value):
+                leaf['value'] = value
+            elif 'value' not in node:
+                leaf['value'] = node['defvalue']
+            reduced[k] = leaf
+    return reduced
+
+class _ManifestView(Mapping):
+    '''Read-only view of a json manifest written with an offset index, see
+    Chip.read_manifest(lazy=True).
+
+    The file is memory mapped and only the byte ranges of the subtrees that
+    are accessed get decoded, each indexed branch on its own and the deepest
+    indexed levels as a whole. Decoded nodes are merged into copies of the
+    schema nodes the view stands for by merge, and keys missing from the
+    manifest are served as copies of the schema nodes, so reads give what a
+    merge into a fresh schema would.
+
+    The mapping is shared by the view and its subviews and stays open until
+    close() is called, or the view is left as a context manager.
+
+    Args:
+        path (str): Manifest file.
+        index (dict): Offset index of the node, see utils.json_dumps_indexed().
+        schema (dict): Schema node matching the node, or None.
+        merge (function): Called as merge(src, dst, keypath) to merge the
+            decoded node src into dst, a copy of the matching schema node,
+            returning the result. If None, src is overlaid onto dst.
+        keypath (tuple): Keypath of the node.
+        data (mmap): Mapped file, shared by the views of one manifest.
+    '''
+
+    def __init__(self, path, index, schema=None, merge=None, keypath=(), data=None):
+        self._path = path
+        self._index = index
+        self._schema = schema
+        self._merge = merge
+        self._keypath = keypath
+        if data is None:
+            with open(path, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = data
+        # decoded children
+        self._nodes = {}
+
+    def __reduce__(self):
+        # the mapping can't be pickled, map the file again
+        return (_ManifestView, (self._path, self._index, self._schema, self._merge,
+                                self._keypath))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        '''Unmaps the manifest file. Nodes decoded before remain readable,
+        the others can't be read any more.'''
+        self._data.close()
+
+    def __getitem__(self, key):
+        node = self._nodes.get(key)
+        if node is not None:
+            return node
+
+        entry = self._index.get(key)
+        schema = None
+        if self._schema is not None:
+            schema = self._schema.get(key, self._schema.get('default'))
+        if entry is None:
+            if self._schema is None or key not in self._schema:
+                raise KeyError(key)
+            node = _own_cfg(self._schema[key])
+        elif len(entry) > 2 and 'defvalue' not in entry[2]:
+            node = _ManifestView(self._path, entry[2], schema, self._merge,
+                                 self._keypath + (key,), self._data)
+        else:
+            node = _decode_cfg(utils.json_loads(self._data[entry[0]:entry[1]]))
+            if schema is not None:
+                if 'defvalue' not in schema:
+                    schema = _own_cfg(schema)
+                if self._merge is not None:
+                    node = self._merge(node, schema, self._keypath + (key,))
+                elif 'defvalue' not in node:
+                    node = _overlay_cfg(schema, node)
+        self._nodes[key] = node
+        return node
+
+    def __contains__(self, key):
+        return key in self._index or (self._schema is not None and key in self._schema)
+
+    def __iter__(self):
+        yield from self._index
+        if self._schema is not None:
+            for key in self._schema:
+                if key not in self._index:
+                    yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+def _encode_cfg(cfg):
+    '''Returns a copy of cfg with values in manifest (string) form.
+
+    Branches and leaf cells are copied, the remaining leaf fields are shared
+    with cfg.
+    '''
+    if 'defvalue' in cfg:
+        if isinstance(cfg, _Parameter):
+            leaf = cfg.todict()
+        else:
+            leaf = dict(cfg)
+        leaf['defvalue'] = _encode_value(leaf['defvalue'])
+        if 'value' in leaf:
+            leaf['value'] = _encode_value(leaf['value'])
+        return leaf
+    return {k: _encode_cfg(v) for k, v in cfg.items()}
+
+def _digest_cfg(cfg):
+    '''Returns the sha256 hex digest of cfg in manifest form, which only
+    depends on its content. The json module serializes it, so the digest
+    doesn't change with the json libraries installed.'''
+    text = json.dumps(_encode_cfg(cfg), sort_keys=True, separators=(',', ':'),
+                      ensure_ascii=False)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def _decode_cfg(cfg, tuples_only=False):
+    '''Converts values of a manifest dict to native form, in place. With
+    tuples_only=True, only tuple values are converted, for manifests that
+    store the others natively but read tuples back as lists (msgpack).'''
+    stack = [cfg]
+    while stack:
+        node = stack.pop()
+        if 'defvalue' in node:
+            desc = _typedesc(node['type'])
+            if tuples_only and desc.kind != 'tuple':
+                continue
+            node['defvalue'] = desc.native(node['defvalue'])
+            if 'value' in node:
+                node['value'] = desc.native(node['value'])
+        else:
+            stack.extend(node.values())
     return cfg
 
 ###############################################################################
@@ -1987,6 +2563,26 @@ def schema_eda(cfg, tool='default', step='default', index='default'):
         """
     }
 
+    cfg['eda'][tool]['manifest'] = {
+        'switch': "-eda_manifest 'tool <str>'",
+        'require': None,
+        'type': '[str]',
+        'lock': 'false',
+        'signature': [],
+        'defvalue': [],
+        'shorthelp': 'Tool manifest keypaths',
+        'example': [
+            "cli: -eda_manifest 'magic pdk'",
+            "api: chip.set('eda','magic','manifest','pdk')"],
+        'help': """
+        Keypaths of the schema sections the tool reads from its manifest,
+        with keys separated by commas (eg. 'eda,magic'). When set, only
+        the parameters below these keypaths are written to the tool
+        manifest, which keeps the file small and quick to load. The full
+        manifest is written if the list is empty.
+        """
+    }
+
     cfg['eda'][tool]['woff'] = {
         'switch': "-eda_woff 'tool <str>'",
         'type': '[str]',
@@ -2319,6 +2915,26 @@ def schema_eda(cfg, tool='default', step='default', index='default'):
         """
     }
 
+    cfg['eda'][tool]['memory'] = {}
+    cfg['eda'][tool]['memory'][step] = {}
+    cfg['eda'][tool]['memory'][step][index] = {
+        'switch': "-eda_memory 'tool step index <float>'",
+        'type': 'float',
+        'lock': 'false',
+        'require': None,
+        'signature': None,
+        'defvalue': None,
+        'shorthelp': 'Tool memory requirement',
+        'example': ["cli: -eda_memory 'openroad place 0 8e9'",
+                    "api: chip.set('eda','openroad','memory','place','0',8e9)"],
+        'help': """
+        Memory in bytes needed to execute the tool, specified on a per tool and
+        per step basis. Tasks are only started when this much of the 'maxmemory'
+        budget is free. If not specified, the task doesn't count against the
+        budget.
+        """
+    }
+
 
 
     return cfg
@@ -3443,6 +4059,101 @@ def schema_options(cfg):
         """
     }
 
+    cfg['maxthreads'] = {
+        'switch': "-maxthreads <int>",
+        'type': 'int',
+        'lock': 'false',
+        'require': None,
+        'signature': None,
+        'defvalue': None,
+        'shorthelp': 'Maximum threads in use',
+        'example': ["cli: -maxthreads 16",
+                    "api: chip.set('maxthreads', 16)"],
+        'help': """
+        Maximum number of threads used by the tasks of a run at the same time,
+        counting the ['eda', tool, 'threads', step, index] of each running
+        task. Tasks that are ready to run wait until enough threads are free.
+        If the parameter is undefined, the number of CPUs of the host is used.
+        """
+    }
+
+    cfg['maxmemory'] = {
+        'switch': "-maxmemory <float>",
+        'type': 'float',
+        'lock': 'false',
+        'require': None,
+        'signature': None,
+        'defvalue': None,
+        'shorthelp': 'Maximum memory in use',
+        'example': ["cli: -maxmemory 64e9",
+                    "api: chip.set('maxmemory', 64e9)"],
+        'help': """
+        Maximum memory in bytes used by the tasks of a run at the same time,
+        counting the ['eda', tool, 'memory', step, index] of each running
+        task. Tasks that are ready to run wait until enough memory is free.
+        If the parameter is undefined, the physical memory of the host is used.
+        """
+    }
+
+    cfg['incremental'] = {
+        'switch': "-incremental <bool>",
+        'type': 'bool',
+        'lock': 'false',
+        'require': 'all',
+        'signature': None,
+        'defvalue': 'false',
+        'shorthelp': 'Incremental run',
+        'example': ["cli: -incremental",
+                    "api: chip.set('incremental', True)"],
+        'help': """
+        Reuses the results of tasks from previous runs of the job that
+        would be identical. A task is skipped when its fingerprint matches
+        the one recorded by its last successful run. The fingerprint covers
+        the parameters that apply to the task, the contents of the files
+        and directories they name, the tool executable and setup module,
+        and the fingerprints of the task's inputs. The job directory is not
+        cleared when the whole flow is run.
+        """
+    }
+
+    cfg['cachedir'] = {
+        'switch': "-cachedir <dir>",
+        'type': 'dir',
+        'lock': 'false',
+        'require': None,
+        'signature': None,
+        'defvalue': None,
+        'shorthelp': 'Task cache directory',
+        'example': ["cli: -cachedir '$HOME/.sc/cache'",
+                    "api: chip.set('cachedir', '$HOME/.sc/cache')"],
+        'help': """
+        Directory of a task result cache that can be shared by all jobs and
+        designs on a machine. Successful tasks store their outputs, reports
+        and manifest in the cache under their fingerprint (see 'incremental').
+        Tasks with a fingerprint found in the cache are not run, the cached
+        results are hard linked into their work directory instead. If the
+        parameter is undefined, no cache is used.
+        """
+    }
+
+    cfg['cachesize'] = {
+        'switch': "-cachesize <float>",
+        'type': 'float',
+        'lock': 'false',
+        'require': None,
+        'signature': None,
+        'defvalue': None,
+        'shorthelp': 'Task cache size',
+        'example': ["cli: -cachesize 50e9",
+                    "api: chip.set('cachesize', 50e9)"],
+        'help': """
+        Maximum size in bytes of the task cache in 'cachedir'. When a task
+        result is stored, the least recently used results are removed until
+        the cache fits. If the parameter is undefined, the cache size is not
+        limited.
+        """
+    }
+
     cfg['env'] = {}
     cfg['env']['default'] = {
         'switch': "-env 'var <str>'",
@@ -5545,4 +6256,4 @@ def schema_mcmm(cfg, scenario='default'):
 # Main routie
 if __name__ == "__main__":
     cfg = schema_cfg()
-    print(json.dumps(cfg, indent=4, sort_keys=True))
+    print(json.dumps(_encode_cfg(cfg), indent=4, sort_keys=True))
@@ -18,6 +18,7 @@ from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives import hashes, serialization
 from siliconcompiler import Chip
+from siliconcompiler.schema import _decode_cfg
 from siliconcompiler.crypto import decrypt_job, gen_cipher_key
 
 class Server:
@@ -157,7 +158,7 @@ class Server:
 
         # Create a dummy Chip object to make schema traversal easier.
         chip = Chip()
-        chip.cfg = cfg
+        chip.cfg = _decode_cfg(cfg)
 
         # Fetch some common values.
         design = chip.get('design')
@@ -58,6 +58,8 @@ def setup_tool(chip):
     chip.set('eda', tool, 'vswitch', '--version')
     chip.set('eda', tool, 'version', '8.3.196')
     chip.set('eda', tool, 'format', 'tcl')
+    # the scripts only read these sections of the manifest
+    chip.set('eda', tool, 'manifest', ['design', 'asic', 'library', 'pdk'])
     chip.set('eda', tool, 'copy', 'true') # copy in .magicrc file
     chip.set('eda', tool, 'threads', step, index,  4)
     chip.set('eda', tool, 'refdir', step, index,  refdir)
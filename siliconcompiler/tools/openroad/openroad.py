@@ -59,15 +59,18 @@ def setup_tool(chip, mode='batch'):
     if (mode=='batch') & (step not in chip.get('bkpt')):
         option += " -exit"
 
-    chip.set('eda', tool, 'exe', tool, clobber=clobber)
-    chip.set('eda', tool, 'vswitch', '-version', clobber=clobber)
-    chip.set('eda', tool, 'version', 'v2.0', clobber=clobber)
-    chip.set('eda', tool, 'format', 'tcl', clobber=clobber)
-    chip.set('eda', tool, 'copy', 'true', clobber=clobber)
-    chip.set('eda', tool, 'option',  step, index, option, clobber=clobber)
-    chip.set('eda', tool, 'refdir',  step, index, refdir, clobber=clobber)
-    chip.set('eda', tool, 'script',  step, index, refdir + script, clobber=clobber)
-    chip.set('eda', tool, 'threads', step, index, os.cpu_count(), clobber=clobber)
+    chip.set_many('eda', tool, {
+        'exe': tool,
+        'vswitch': '-version',
+        'version': 'v2.0',
+        'format': 'tcl',
+        'copy': 'true',
+        ('option', step, index): option,
+        ('refdir', step, index): refdir,
+        ('script', step, index): refdir + script,
+        # tasks run in parallel share the 'maxthreads' budget
+        ('threads', step, index): min(os.cpu_count(), chip.get('maxthreads') or os.cpu_count())
+    }, clobber=clobber)
 
     # Input/Output requirements
     if step == 'floorplan':
@@ -152,7 +152,7 @@ def post_process(chip):
             sys.exit()
         else:
             chip.logger.info('Setting design (topmodule) to %s', topmodule)
-            chip.cfg['design']['value'].append(topmodule)
+            chip.set('design', topmodule)
     else:
         topmodule = chip.cfg['design']['value']
 
@@ -1,6 +1,27 @@
+import json
 import os
 import shutil
 
+import yaml
+
+# Optional faster JSON libraries, the json module is used when neither
+# is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+# Optional binary manifest format, see msgpack_dumps()
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+# libyaml bindings of PyYAML, see yaml_dumps() and yaml_load()
+YAML_CLIB = yaml.__with_libyaml__
+
 def copytree(src, dst, ignore=[], dirs_exist_ok=False, link=False):
     '''Simple implementation of shutil.copytree to give us a dirs_exist_ok
     option in Python < 3.8.
@@ -18,8 +39,178 @@ def copytree(src, dst, ignore=[], dirs_exist_ok=False, link=False):
         dstfile = os.path.join(dst, name)
 
         if os.path.isdir(srcfile):
-            copytree(srcfile, dstfile, ignore=ignore, dirs_exist_ok=dirs_exist_ok)
+            copytree(srcfile, dstfile, ignore=ignore, dirs_exist_ok=dirs_exist_ok, link=link)
         elif link:
             os.link(srcfile, dstfile)
         else:
             shutil.copy2(srcfile, dstfile)
+
+def total_memory():
+    '''Returns the physical memory of the host in bytes, or None where it
+    can't be queried.'''
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def json_dumps(obj, compact=False):
+    '''Returns obj serialized as a JSON string with sorted keys.
+
+    By default the output is indented for human readers and always written
+    by the json module, so it doesn't depend on what is installed. With
+    compact=True the output has no whitespace and is produced by orjson or
+    ujson when available.
+    '''
+    if not compact:
+        return json.dumps(obj, indent=4, sort_keys=True)
+    elif orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+    elif ujson is not None:
+        return ujson.dumps(obj, sort_keys=True, escape_forward_slashes=False)
+    else:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'))
+
+def json_dumps_indexed(obj, depth, compact=False):
+    '''Returns obj serialized as by json_dumps(), along with an offset index
+    of the values found in the first depth levels of nested dicts.
+
+    The index maps each key to [start, end] or, for dicts that were
+    descended into, to [start, end, children], where start and end are the
+    byte offsets of the value in the utf-8 encoded output and children is
+    the index of the value's own keys.
+    '''
+    pieces = []
+    index = _dump_indexed(obj, depth, compact, 0, pieces, [0])
+    return ''.join(pieces), index[2]
+
+def _dump_indexed(obj, depth, compact, level, pieces, pos):
+    '''Appends obj serialized at nesting level to pieces and returns its
+    index entry, pos holds the current byte offset.'''
+
+    def emit(text):
+        pieces.append(text)
+        pos[0] += len(text.encode()) if not text.isascii() else len(text)
+
+    start = pos[0]
+    if depth == 0 or not isinstance(obj, dict) or not obj:
+        text = json_dumps(obj, compact=compact)
+        if not compact:
+            # nested the way json.dumps() nests it
+            text = text.replace('\n', '\n' + '    ' * level)
+        emit(text)
+        return [start, pos[0]]
+
+    children = {}
+    if compact:
+        emit('{')
+    else:
+        emit('{\n')
+    for i, key in enumerate(sorted(obj)):
+        if i > 0:
+            emit(',' if compact else ',\n')
+        if compact:
+            emit(json.dumps(key) + ':')
+        else:
+            emit('    ' * (level + 1) + json.dumps(key) + ': ')
+        children[key] = _dump_indexed(obj[key], depth - 1, compact, level + 1, pieces, pos)
+    if compact:
+        emit('}')
+    else:
+        emit('\n' + '    ' * level + '}')
+    return [start, pos[0], children]
+
+def json_load(f):
+    '''Returns the object read from the JSON file f, opened in text or
+    binary mode, using the fastest JSON library available.'''
+    return json_loads(f.read())
+
+def json_loads(data):
+    '''Returns the object read from the JSON str or bytes data, using the
+    fastest JSON library available.'''
+    if orjson is not None:
+        return orjson.loads(data)
+    elif ujson is not None:
+        return ujson.loads(data)
+    else:
+        return json.loads(data)
+
+def msgpack_dumps(obj):
+    '''Returns obj serialized in msgpack form. Values are stored natively,
+    tuples become arrays and mappings other than dict (eg. schema
+    parameters) become maps. Requires msgpack to be installed.'''
+    return msgpack.packb(obj, default=dict)
+
+def msgpack_load(f):
+    '''Returns the object read from the msgpack file f, opened in binary
+    mode. Arrays are read back as lists.'''
+    return msgpack_loads(f.read())
+
+def msgpack_loads(data):
+    '''Returns the object read from the msgpack bytes data. Arrays are read
+    back as lists.'''
+    return msgpack.unpackb(data, raw=False)
+
+class YamlIndentDumper(yaml.Dumper):
+    def increase_indent(self, flow=False, indentless=False):
+        return super(YamlIndentDumper, self).increase_indent(flow, False)
+
+    def ignore_aliases(self, data):
+        # schema lists may be shared between parameters, always write them out
+        return True
+
+if YAML_CLIB:
+    class _YamlCDumper(yaml.CDumper):
+        def ignore_aliases(self, data):
+            return True
+
+def yaml_dumps(obj):
+    '''Returns obj serialized as block style YAML, the way YamlIndentDumper
+    writes it, using libyaml when available.
+
+    The libyaml emitter can't be customized and writes sequences that are
+    mapping values at the indentation of their key, these are indented
+    afterwards (see _indent_sequences()).
+    '''
+    if not YAML_CLIB:
+        return yaml.dump(obj, Dumper=YamlIndentDumper, default_flow_style=False)
+    text = yaml.dump(obj, Dumper=_YamlCDumper, default_flow_style=False)
+    return _indent_sequences(text)
+
+def _indent_sequences(text):
+    '''Returns the YAML text with each block sequence that starts at the
+    indentation of its mapping key, along with everything nested in it,
+    indented by two more spaces.'''
+
+    lines = text.split('\n')
+    # original indentation of the open indentless sequences
+    open_seqs = []
+    # indentation of the key opening a nested block on the previous line
+    key_col = None
+    for i, line in enumerate(lines):
+        content = line.lstrip(' ')
+        if not content:
+            continue
+        col = len(line) - len(content)
+        item = content == '-' or content.startswith('- ')
+        while open_seqs and (col < open_seqs[-1] or (col == open_seqs[-1] and not item)):
+            open_seqs.pop()
+        if item and col == key_col and (not open_seqs or open_seqs[-1] != col):
+            open_seqs.append(col)
+        if open_seqs:
+            lines[i] = '  ' * len(open_seqs) + line
+        # mapping keys with nothing after them, past any sequence items
+        # opened on the same line
+        key_col = None
+        if content.endswith(':'):
+            while content.startswith('- '):
+                col += 2
+                content = content[2:]
+            key_col = col
+    return '\n'.join(lines)
+
+def yaml_load(f):
+    '''Returns the object read from the YAML file f with the safe loader,
+    using libyaml when available.'''
+    if YAML_CLIB:
+        return yaml.load(f, Loader=yaml.CSafeLoader)
+    return yaml.load(f, Loader=yaml.SafeLoader)
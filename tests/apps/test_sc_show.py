@@ -5,6 +5,10 @@ import siliconcompiler
 
 from siliconcompiler.apps import sc_show
 from siliconcompiler import Chip
+from siliconcompiler import utils
+
+# task manifests are written in msgpack form when it is installed
+suffix = 'pkg.msgpack' if utils.msgpack is not None else 'pkg.json'
 
 # TODO: I think moving back to something like a tarfile would be nice here to
 # remove the dependency on EDA tools. Maybe make that tarfile the single source
@@ -34,7 +38,7 @@ def heartbeat_dir(tmpdir_factory):
     ['-read_gds', 'show 0 build/heartbeat/job0/export/0/outputs/heartbeat.gds'],
     ['-design', 'heartbeat'],
     ['-read_def', '"show 0 build/heartbeat/job0/export/0/inputs/heartbeat.def"',
-        '-cfg', 'build/heartbeat/job0/export/0/outputs/heartbeat.pkg.json']
+        '-cfg', f'build/heartbeat/job0/export/0/outputs/heartbeat.{suffix}']
     ])
 @pytest.mark.eda
 @pytest.mark.quick
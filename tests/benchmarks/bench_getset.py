@@ -0,0 +1,53 @@
+# Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+'''Microbenchmark for Chip.get()/set() keypath resolution.
+
+Compares lookups served by the compiled leaf index (self.cfg) against the
+same lookups resolved by walking the schema tree (alternate cfg).
+
+Run from the SC root directory: python -m tests.benchmarks.bench_getset
+'''
+import copy
+
+from tests.benchmarks.common import asicflow_chip, measure, report
+
+def main():
+    chip = asicflow_chip()
+    walkcfg = copy.deepcopy(chip.cfg)
+    keys = [tuple(key) for key in chip.getkeys() if 'default' not in key]
+
+    # Index and walk must resolve to identical values
+    for key in keys:
+        assert chip.get(*key) == chip.get(*key, cfg=walkcfg), key
+
+    def lookup_walk():
+        for key in keys:
+            chip._lookup(walkcfg, key)
+
+    def lookup_index():
+        for key in keys:
+            chip._lookup(chip.cfg, key)
+
+    def get_walk():
+        for key in keys:
+            chip.get(*key, cfg=walkcfg)
+
+    def get_index():
+        for key in keys:
+            chip.get(*key)
+
+    def set_walk():
+        for index in range(100):
+            chip.set('eda', 'openroad', 'option', 'place', str(index), '-v', cfg=walkcfg)
+
+    def set_index():
+        for index in range(100):
+            chip.set('eda', 'openroad', 'option', 'place', str(index), '-v')
+
+    print(f'{len(keys)} keypaths, best of 5 runs')
+    print(f'{"":<40} {"walk":>13} {"index":>13}')
+    report(f'keypath lookup x {len(keys)}', measure(lookup_walk), measure(lookup_index))
+    report(f'get() x {len(keys)}', measure(get_walk), measure(get_index))
+    report('set() x 100 (with default expansion)', measure(set_walk), measure(set_index))
+
+if __name__ == '__main__':
+    main()
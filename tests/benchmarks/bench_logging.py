@@ -0,0 +1,45 @@
+# Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+'''Benchmark for debug logging overhead in Chip.get()/set().
+
+Times a 100k call get/set loop with the logger at DEBUG, where every call
+formats its keypath and debug message, and at INFO, where get()/set() skip
+the formatting.
+
+Run from the SC root directory: python -m tests.benchmarks.bench_logging
+'''
+import logging
+
+from tests.benchmarks.common import asicflow_chip, measure, report
+
+CALLS = 100000
+
+def main():
+    chip = asicflow_chip()
+    keypath = ('eda', 'openroad', 'option', 'place', '0')
+    chip.set(*keypath, '-v')
+    # debug messages are formatted, but not printed
+    for handler in chip.logger.handlers:
+        handler.setLevel(logging.INFO)
+
+    def get_loop():
+        for _ in range(CALLS):
+            chip.get(*keypath)
+
+    def set_loop():
+        for _ in range(CALLS):
+            chip.set(*keypath, '-v')
+
+    def timed(func):
+        chip.logger.setLevel('DEBUG')
+        debug = measure(func, repeat=3)
+        chip.logger.setLevel('INFO')
+        info = measure(func, repeat=3)
+        return debug, info
+
+    print(f'{CALLS} calls, best of 3 runs')
+    print(f'{"":<40} {"DEBUG":>13} {"INFO":>13}')
+    report('get()', *timed(get_loop))
+    report('set()', *timed(set_loop))
+
+if __name__ == '__main__':
+    main()
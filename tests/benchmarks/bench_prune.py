@@ -0,0 +1,23 @@
+# Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+'''Benchmark for pruning the Chip configuration before writing a manifest.
+
+Times the single pass _prune() on a full asicflow manifest, next to the
+structural copy of the configuration write_manifest(prune=False) makes.
+
+Run from the SC root directory: python -m tests.benchmarks.bench_prune
+'''
+from siliconcompiler.schema import _copy_cfg
+from tests.benchmarks.common import asicflow_chip, measure, report
+
+def main():
+    chip = asicflow_chip()
+    pruned = chip._prune(chip.cfg)
+
+    print(f'{len(chip.getkeys())} keypaths, {len(chip.getkeys(cfg=pruned))} after pruning, '
+          'best of 5 runs')
+    report('_copy_cfg()', measure(lambda: _copy_cfg(chip.cfg)))
+    report('_prune()', measure(lambda: chip._prune(chip.cfg)))
+    report('_prune(keeplists=True)', measure(lambda: chip._prune(chip.cfg, keeplists=True)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+'''Benchmark for writing and reading YAML manifests.
+
+Compares the pure Python PyYAML loader and dumper against the libyaml ones,
+on the asicflow manifest.
+
+Run from the SC root directory: python -m tests.benchmarks.bench_yaml
+'''
+import os
+import tempfile
+
+from siliconcompiler import utils
+from tests.benchmarks.common import asicflow_chip, measure, report
+
+def main():
+    if not utils.YAML_CLIB:
+        print('PyYAML was built without libyaml, nothing to compare')
+        return
+
+    chip = asicflow_chip()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manifest = os.path.join(tmpdir, 'gcd.yaml')
+
+        def timed(func):
+            utils.YAML_CLIB = False
+            before = measure(func, repeat=3)
+            utils.YAML_CLIB = True
+            after = measure(func, repeat=3)
+            return before, after
+
+        # Both must write the same data
+        utils.YAML_CLIB = False
+        chip.write_manifest(manifest)
+        expected = chip.read_manifest(manifest, update=False)
+        utils.YAML_CLIB = True
+        chip.write_manifest(manifest)
+        assert chip.read_manifest(manifest, update=False) == expected
+
+        print(f'{len(chip.getkeys())} keypaths, file size: {os.path.getsize(manifest)} bytes, '
+              'best of 3 runs')
+        print(f'{"":<40} {"python":>13} {"libyaml":>13}')
+        def write():
+            # unchanged manifests aren't written again
+            os.remove(manifest)
+            chip.write_manifest(manifest)
+
+        report('write_manifest(.yaml)', *timed(write))
+        report('read_manifest(.yaml, update=False)',
+               *timed(lambda: chip.read_manifest(manifest, update=False)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+# Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+import time
+
+from tests.fixtures import gcd_chip
+
+def asicflow_chip():
+    '''Returns the GCD example chip with every asicflow tool set up, giving a
+    manifest the size of a real run without running any tools.'''
+
+    chip = gcd_chip()
+    chip.logger.setLevel('ERROR')
+    for step in chip.getkeys('flowgraph'):
+        for index in chip.getkeys('flowgraph', step):
+            tool = chip.get('flowgraph', step, index, 'tool')
+            if tool in chip.builtin:
+                continue
+            chip.set('arg', 'step', step)
+            chip.set('arg', 'index', index)
+            # tools whose setup needs optional compiled modules are skipped
+            setup_tool = chip.find_function(tool, 'tool', 'setup_tool')
+            if setup_tool:
+                setup_tool(chip)
+    chip.set('arg', 'step', None)
+    chip.set('arg', 'index', None)
+    chip.error = 0
+
+    return chip
+
+def measure(func, repeat=5):
+    '''Returns the best wall time in seconds of repeat calls to func().'''
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def report(name, *times):
+    '''Prints a row of timings in seconds, and the ratio of the first to the
+    last if there are several.'''
+
+    row = f'{name:<40}' + ''.join(f' {t*1e3:10.3f} ms' for t in times)
+    if len(times) > 1:
+        row += f' {times[0]/times[-1]:8.1f}x'
+    print(row)
@@ -0,0 +1,28 @@
+# Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+import os
+import siliconcompiler
+
+def test_find_result():
+    '''Ensure results are only found in the requested form, while task
+    manifests are found in either form.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'top')
+    outdir = os.path.join(chip._getworkdir(step='syn'), 'outputs')
+    os.makedirs(outdir)
+    # a task manifest written in msgpack form
+    open(os.path.join(outdir, 'top.pkg.msgpack'), 'w').close()
+    open(os.path.join(outdir, 'top.vg'), 'w').close()
+
+    assert chip.find_result('vg', step='syn') == os.path.join(outdir, 'top.vg')
+    assert chip.find_result('pkg.msgpack', step='syn') == os.path.join(outdir, 'top.pkg.msgpack')
+    assert chip.error == 0
+    assert chip.find_manifest(step='syn') == os.path.join(outdir, 'top.pkg.msgpack')
+    assert chip.error == 0
+
+    assert chip.find_result('pkg.json', step='syn') is None
+    assert chip.error == 1
+
+    chip.error = 0
+    assert chip.find_manifest(step='place') is None
+    assert chip.error == 1
@@ -9,6 +9,47 @@ def test_getdict():
 
     assert localcfg['process']['value'] == 'freepdk45'
 
+def test_getdict_copy():
+    '''Writes to the chip must not show up in dictionaries returned earlier,
+    and vice versa.'''
+
+    chip = siliconcompiler.Chip()
+    chip.add('source', 'a.v')
+    localcfg = chip.getdict('source')
+    localcfg['value'].append('b.v')
+    assert chip.get('source') == ['a.v']
+
+    edacfg = chip.getdict('eda')
+    chip.set('eda', 'yosys', 'option', 'syn', '0', '-v')
+    assert 'yosys' not in edacfg
+
+    snapshot = chip.getdict('design')
+    chip.set('design', 'top')
+    assert snapshot['value'] is None
+
+    # the result is private, writes don't reach the chip or the schema
+    asiccfg = chip.getdict('asic')
+    asiccfg['diearea']['value'] = [(0, 0), (1, 1)]
+    asiccfg['diearea']['defvalue'].append((2, 2))
+    assert chip.get('asic', 'diearea') == []
+    assert siliconcompiler.Chip().get('asic', 'diearea') == []
+
+def test_cfghistory_copy():
+    '''History snapshots share leaf cells but not writes.'''
+
+    from siliconcompiler.schema import _copy_cfg
+
+    chip = siliconcompiler.Chip()
+    chip.add('source', 'a.v')
+    snapshot = _copy_cfg(chip.cfg)
+    chip.add('source', 'b.v')
+    chip.set('source', False, field='copy')
+    assert chip.get('source', cfg=snapshot) == ['a.v']
+    assert chip.get('source', field='copy', cfg=snapshot) is True
+    assert chip.get('source') == ['a.v', 'b.v']
+
 #########################
 if __name__ == "__main__":
     test_getdict()
+    test_getdict_copy()
+    test_cfghistory_copy()
@@ -0,0 +1,31 @@
+# Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+import siliconcompiler
+
+def test_getkeys_cache():
+    '''getkeys() must track branches created by set() and add() and hand
+    out private lists.'''
+
+    chip = siliconcompiler.Chip()
+    allkeys = chip.getkeys()
+    assert ['design'] in allkeys
+    assert ['eda', 'yosys', 'exe'] not in allkeys
+
+    # callers may modify what they get back
+    allkeys[0][0] = None
+    allkeys.clear()
+    assert chip.getkeys()[0][0] is not None
+
+    # setting an existing parameter doesn't change the keypaths
+    chip.set('design', 'top')
+    assert len(chip.getkeys()) == len(chip.getkeys(cfg=chip.cfg))
+
+    chip.set('eda', 'yosys', 'exe', 'yosys')
+    chip.add('flowgraph', 'syn', '0', 'input', 'import0')
+    allkeys = chip.getkeys()
+    assert ['eda', 'yosys', 'exe'] in allkeys
+    assert ['flowgraph', 'syn', '0', 'input'] in allkeys
+    assert allkeys == chip._allkeys(chip.cfg)
+
+#########################
+if __name__ == "__main__":
+    test_getkeys_cache()
@@ -3,7 +3,7 @@ import os
 import copy
 import siliconcompiler
 
-from siliconcompiler.schema import schema_flowgraph
+from siliconcompiler.schema import schema_flowgraph, _copy_cfg
 
 def test_merge_manifest():
 
@@ -23,6 +23,45 @@ def test_merge_manifest():
     # ensure our value is reflected in chip's cfg
     assert chip.get('flowgraph', 'syn', '0', 'tool') == 'yosys'
 
+def test_merge_manifest_modes():
+    '''Ensure clobber, clear and lock behave the same with and without type checks'''
+
+    src = siliconcompiler.Chip()
+    src.set('design', 'top')
+    src.add('source', 'b.v')
+    src.set('source', False, field='copy')
+    src.set('constraint', 'top.sdc')
+    src.write_manifest('src.json')
+    cfg = src.read_manifest('src.json', update=False)
+
+    for typecheck in (True, False):
+        chip = siliconcompiler.Chip()
+        chip.set('design', 'keep')
+        chip.add('source', 'a.v')
+        chip.set('constraint', 'a.sdc')
+        chip.set('constraint', True, field='lock')
+        chip.merge_manifest(cfg, clobber=False, clear=False, typecheck=typecheck)
+
+        assert chip.get('design') == 'keep'
+        assert chip.get('source') == ['a.v', 'b.v']
+        assert chip.get('source', field='copy') is False
+        assert chip.get('constraint') == ['a.sdc']
+        assert ('source',) in chip._paramindex('copy', False)
+
+        # merging an unchanged manifest leaves the parameters untouched
+        leaf = chip.cfg['design']
+        chip.merge_manifest(_copy_cfg(chip.cfg), typecheck=typecheck)
+        assert chip.cfg['design'] is leaf
+
+def test_merge_manifest_typecheck():
+    '''Ensure values are type checked unless typecheck is False'''
+
+    chip = siliconcompiler.Chip()
+    chip.merge_manifest({'relax': {'type': 'bool', 'defvalue': False,
+                                   'lock': 'false', 'value': 'maybe'}})
+    assert chip.error == 1
+    assert chip.get('relax') is False
+
 #########################
 if __name__ == "__main__":
     test_merge_manifest()
@@ -15,6 +15,21 @@ def test_multichip():
     assert a.get('design',cfg=b.cfg) == 'adder'
     assert a.get('design',cfg=c.cfg) == 'mult'
 
+def test_multichip_shared_schema():
+    '''Chips share one schema template, writes must stay private.'''
+
+    a = siliconcompiler.Chip(design='top')
+    a.add('source', 'top.v')
+    a.set('eda', 'yosys', 'exe', 'yosys')
+    a.set('relax', True)
+
+    b = siliconcompiler.Chip()
+    assert b.get('design') is None
+    assert b.get('source') == []
+    assert 'yosys' not in b.getkeys('eda')
+    assert b.get('relax') is False
+
 #########################
 if __name__ == "__main__":
     test_multichip()
+    test_multichip_shared_schema()
@@ -0,0 +1,79 @@
+# Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+import pytest
+
+import siliconcompiler
+
+def test_parameter_dict_view():
+    '''Schema leaf cells must behave like the dicts they replace.'''
+
+    chip = siliconcompiler.Chip()
+    chip.add('source', 'top.v')
+    leaf = chip.cfg['source']
+
+    assert 'defvalue' in leaf
+    assert leaf['value'] == ['top.v']
+    assert leaf['type'] == '[file]'
+    assert dict(leaf)['copy'] == 'true'
+    assert sorted(leaf) == sorted(leaf.keys())
+    assert len(leaf) == len(dict(leaf))
+
+def test_parameter_shared_definition():
+    '''Instances of one definition share static fields, writes stay local.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('flowgraph', 'syn', '0', 'tool', 'yosys')
+    chip.set('flowgraph', 'syn', '1', 'tool', 'yosys')
+    a = chip.cfg['flowgraph']['syn']['0']['tool']
+    b = chip.cfg['flowgraph']['syn']['1']['tool']
+    assert a is not b
+    assert a['help'] is b['help']
+
+    chip.set('flowgraph', 'syn', '1', 'tool', 'surelog')
+    assert chip.get('flowgraph', 'syn', '0', 'tool') == 'yosys'
+
+    # writing a static field only changes this instance
+    chip.set('flowgraph', 'syn', '1', 'tool', 'none', field='shorthelp')
+    assert chip.get('flowgraph', 'syn', '1', 'tool', field='shorthelp') == 'none'
+    assert chip.get('flowgraph', 'syn', '0', 'tool', field='shorthelp') != 'none'
+
+def test_parameter_direct_write():
+    '''Writing to a leaf cell of chip.cfg in place only changes that chip.'''
+
+    chip = siliconcompiler.Chip()
+    other = siliconcompiler.Chip()
+    chip.cfg['asic']['diearea']['value'] = [(0, 0), (5, 5)]
+    chip.set('flowgraph', 'syn', '0', 'tool', 'yosys')
+    chip.cfg['flowgraph']['syn']['0']['timeout']['value'] = 10.0
+
+    assert chip.get('asic', 'diearea') == [(0, 0), (5, 5)]
+    assert other.get('asic', 'diearea') == []
+    assert siliconcompiler.Chip().get('asic', 'diearea') == []
+
+    # steps added later don't see writes to another step
+    chip.set('flowgraph', 'syn', '1', 'tool', 'yosys')
+    assert chip.get('flowgraph', 'syn', '1', 'timeout') is None
+
+def test_parameter_template_readonly():
+    '''Leaf cells of the schema template refuse writes, copies accept them.'''
+
+    from siliconcompiler.schema import _schema_template
+
+    leaf = _schema_template()['asic']['diearea']
+    with pytest.raises(TypeError):
+        leaf['value'] = [(0, 0), (5, 5)]
+    with pytest.raises(TypeError):
+        leaf['shorthelp'] = 'none'
+    with pytest.raises(TypeError):
+        del leaf['value']
+
+    copy = leaf.copy()
+    copy['value'] = [(0, 0), (5, 5)]
+    assert 'value' not in leaf
+    assert siliconcompiler.Chip().get('asic', 'diearea') == []
+
+#########################
+if __name__ == "__main__":
+    test_parameter_dict_view()
+    test_parameter_shared_definition()
+    test_parameter_direct_write()
+    test_parameter_template_readonly()
@@ -0,0 +1,40 @@
+# Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+import siliconcompiler
+
+def _scan(chip, field, value):
+    keypaths = []
+    for keypath in chip.getkeys():
+        if field == 'type':
+            match = value in chip.get(*keypath, field='type')
+        else:
+            match = chip.get(*keypath, field=field) == value
+        if match:
+            keypaths.append(tuple(keypath))
+    return sorted(keypaths)
+
+def test_paramindex():
+    '''The field indexes must agree with a full scan of the schema after
+    new parameters are created and indexed fields are changed.'''
+
+    chip = siliconcompiler.Chip()
+    chip.target('asicflow_freepdk45')
+
+    assert sorted(chip._paramindex('type', 'file')) == _scan(chip, 'type', 'file')
+
+    chip.set('eda', 'yosys', 'script', 'syn', '0', 'syn.tcl')
+    chip.set('source', False, field='copy')
+    chip.set('design', 'asic', field='require')
+
+    for field, value in (('type', 'file'),
+                         ('type', 'dir'),
+                         ('copy', True),
+                         ('require', 'all'),
+                         ('require', 'asic')):
+        assert sorted(chip._paramindex(field, value)) == _scan(chip, field, value)
+
+    assert ('eda', 'yosys', 'script', 'syn', '0') in chip._paramindex('type', 'file')
+    assert ('source',) not in chip._paramindex('copy', True)
+
+#########################
+if __name__ == "__main__":
+    test_paramindex()
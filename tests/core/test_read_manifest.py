@@ -1,4 +1,5 @@
 # Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+import json
 import os
 import siliconcompiler
 
@@ -21,6 +22,158 @@ def test_read_manifest_fields():
     chip2.read_manifest('tmp.json')
     assert chip2.get('source', field='copy') is False
 
+def test_read_manifest_types():
+    '''Ensure that typed values survive a write/read round trip'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('relax', True)
+    chip.set('clock', 'clk', 'period', '2.5')
+    chip.set('flowgraph', 'syn', '0', 'weight', 'cellarea', 1)
+    chip.set('asic', 'diearea', [(0, 0), (100.5, 200)])
+    chip.write_manifest('types.json')
+
+    chip2 = siliconcompiler.Chip()
+    chip2.read_manifest('types.json')
+    assert chip2.get('relax') is True
+    assert chip2.get('clock', 'clk', 'period') == 2.5
+    assert chip2.get('flowgraph', 'syn', '0', 'weight', 'cellarea') == 1.0
+    assert chip2.get('asic', 'diearea') == [(0.0, 0.0), (100.5, 200.0)]
+
+def test_read_manifest_delta():
+    '''Ensure that a delta manifest reads back as the full manifest'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'top')
+    chip.add('source', 'top.v')
+    chip.write_manifest('base.json', compact=True)
+    chip._deltabase = os.path.abspath('base.json')
+    chip._deltacfg = siliconcompiler.schema._copy_cfg(chip.cfg)
+
+    chip.set('relax', True)
+    chip.add('source', 'sub.v')
+    chip.set('metric', 'syn', '0', 'cellarea', 'real', 10.5)
+    chip._write_delta('delta.json')
+    chip.write_manifest('full.json')
+
+    with open('delta.json') as f:
+        delta = json.load(f)
+    assert delta['__delta__'] == {'base': 'base.json'}
+    assert 'design' not in delta
+    assert set(delta['metric']['syn']['0']['cellarea']) == {'real'}
+
+    # fresh chip, the base is read and the delta applied on top
+    chip2 = siliconcompiler.Chip()
+    chip2.read_manifest('delta.json')
+    chip3 = siliconcompiler.Chip()
+    chip3.read_manifest('full.json')
+    for keypath in chip3.getkeys():
+        assert chip2.get(*keypath) == chip3.get(*keypath)
+
+    # chip holding the base, only the changes are merged
+    chip4 = siliconcompiler.Chip()
+    chip4.read_manifest('base.json')
+    chip4._deltabase = os.path.abspath('base.json')
+    localcfg = chip4.read_manifest('delta.json')
+    assert 'design' not in localcfg
+    assert chip4.get('source') == ['top.v', 'sub.v']
+    assert chip4.get('metric', 'syn', '0', 'cellarea', 'real') == 10.5
+
+def test_read_manifest_lazy():
+    '''Ensure a lazy view reads like the manifest it maps'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'top')
+    chip.add('source', 'top.v')
+    chip.set('metric', 'syn', '0', 'cellarea', 'real', 10.5)
+    chip.set('metric', 'syn', '1', 'cellarea', 'real', 12)
+    chip.set('asic', 'diearea', [(0, 0), (100.5, 200)])
+    chip.write_manifest('top.json', index=True)
+
+    chip2 = siliconcompiler.Chip()
+    chip2.read_manifest('top.json', job='job0')
+    chip3 = siliconcompiler.Chip()
+    view = chip3.read_manifest('top.json', job='job0', lazy=True)
+    assert isinstance(view, siliconcompiler.schema._ManifestView)
+    assert chip3.get('metric', 'syn', '1', 'cellarea', 'real', job='job0') == 12.0
+    # only the subtree of the metric was decoded
+    assert set(view._nodes) == {'metric'}
+    assert set(view['metric']._nodes) == {'syn'}
+
+    for keypath in chip2.getkeys(cfg=chip2.cfghistory['job0']):
+        assert chip3.get(*keypath, job='job0') == chip2.get(*keypath, job='job0')
+    assert chip3.error == 0
+
+    # nodes missing from the manifest are copies of the schema
+    assert view['fpga'] is not siliconcompiler.schema._schema_template()['fpga']
+    view['fpga']['arch']['value'] = ['x.xml']
+    assert siliconcompiler.Chip().get('fpga', 'arch') == []
+
+    # reading the job again closes the view
+    chip3.read_manifest('top.json', job='job0')
+    assert view._data.closed
+
+    with chip3.read_manifest('top.json', update=False, lazy=True) as view:
+        assert view['design']['value'] == 'top'
+    assert view._data.closed
+
+    # an outdated index is not used
+    chip.write_manifest('top.json')
+    assert isinstance(chip3.read_manifest('top.json', job='job1', lazy=True), dict)
+
+def test_read_manifest_lazy_lock():
+    '''Ensure views of a manifest follow the merge rules for locked parameters'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'top')
+    chip.cfg['version']['schema']['value'] = '0.0.0'
+    chip.write_manifest('top.json', index=True)
+
+    chip2 = siliconcompiler.Chip()
+    chip2.read_manifest('top.json', job='job0')
+    chip3 = siliconcompiler.Chip()
+    chip3.read_manifest('top.json', job='job0', lazy=True)
+    assert chip3.get('version', 'schema', job='job0') == chip2.get('version', 'schema', job='job0')
+    assert chip3.get('version', 'schema', job='job0') != '0.0.0'
+
+def test_read_manifest_inputs():
+    '''Ensure merging the inputs of a task in a tree matches reading them in order'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'top')
+    chip.write_manifest('base.json')
+
+    files = []
+    for i in range(5):
+        chip = siliconcompiler.Chip()
+        chip.read_manifest('base.json')
+        chip.set('metric', 'syn', str(i), 'cellarea', 'real', i)
+        chip.set('metric', 'syn', '0', 'errors', 'real', i)
+        if i > 1:
+            chip.set('clock', 'clk', 'period', i)
+            chip.add('source', f'{i}.v')
+        if i == 2:
+            chip.set('clock', 'clk', 'period', True, field='lock')
+        if i % 2:
+            chip.set('relax', True)
+        chip.write_manifest(f'in{i}.json')
+        files.append(f'in{i}.json')
+
+    chip2 = siliconcompiler.Chip()
+    chip2.read_manifest('base.json')
+    for f in files:
+        chip2.read_manifest(f, clobber=False)
+    chip3 = siliconcompiler.Chip()
+    chip3.read_manifest('base.json')
+    chip3._read_inputs(files)
+
+    # the first non-empty value wins, 0 included
+    assert chip3.get('metric', 'syn', '0', 'errors', 'real') == 0
+    assert chip3.get('clock', 'clk', 'period') == 2
+    assert chip3.get('clock', 'clk', 'period', field='lock') is True
+    for keypath in chip2.getkeys():
+        assert chip3.get(*keypath) == chip2.get(*keypath)
+        assert chip3.get(*keypath, field='lock') == chip2.get(*keypath, field='lock')
+
 #########################
 if __name__ == "__main__":
     from tests.fixtures import datadir
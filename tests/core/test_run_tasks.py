@@ -0,0 +1,312 @@
+import logging
+import os
+import time
+
+import siliconcompiler
+
+def test_run_tasks(monkeypatch):
+    '''Tasks are only started once their inputs are done, and report their
+    error bits back to run().'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'test')
+    chip.set('mode', 'sim')
+    chip.node('import', 'join')
+    for i in range(3):
+        chip.node('work', 'join', index=i)
+        chip.edge('import', 'work', head_index=i)
+        chip.edge('work', 'sel', tail_index=i)
+    chip.node('sel', 'minimum')
+
+    def fake_runtask(chip, step, index, active, error):
+        # inputs have written their outputs before the task starts
+        for in_step, in_index in chip.get('flowgraph', step, index, 'input'):
+            assert not active[in_step + in_index]
+            indir = chip._getworkdir(step=in_step, index=in_index)
+            assert os.path.isfile(os.path.join(indir, 'outputs', 'done'))
+        outdir = os.path.join(chip._getworkdir(step=step, index=index), 'outputs')
+        os.makedirs(outdir, exist_ok=True)
+        open(os.path.join(outdir, 'done'), 'w').close()
+        # one failing task
+        if step + index != 'work1':
+            error[step + index] = 0
+        active[step + index] = 0
+
+    monkeypatch.setattr(siliconcompiler.Chip, '_runtask', fake_runtask)
+
+    tasks = [('import', '0'), ('work', '0'), ('work', '1'), ('work', '2'), ('sel', '0')]
+    active = {step + index: 1 for step, index in tasks}
+    error = {step + index: 1 for step, index in tasks}
+    chip._run_tasks(tasks, active, error)
+
+    assert not any(active.values())
+    assert error == {'import0': 0, 'work0': 0, 'work1': 1, 'work2': 0, 'sel0': 0}
+    assert chip.logger is not None
+
+
+def test_run_tasks_budget(monkeypatch, tmp_path):
+    '''Tasks only run together while their threads fit in 'maxthreads'.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'test')
+    chip.set('mode', 'sim')
+    for i in range(6):
+        chip.node('work', 'join', index=i)
+    chip.set('maxthreads', 2)
+
+    def fake_runtask(chip, step, index, active, error):
+        start = time.time()
+        time.sleep(0.2)
+        with open(tmp_path / f'{step}{index}', 'w') as f:
+            f.write(f'{start} {time.time()}')
+        error[step + index] = 0
+
+    monkeypatch.setattr(siliconcompiler.Chip, '_runtask', fake_runtask)
+
+    tasks = [('work', str(i)) for i in range(6)]
+    active = {step + index: 1 for step, index in tasks}
+    error = {step + index: 1 for step, index in tasks}
+    chip._run_tasks(tasks, active, error)
+
+    assert not any(error.values())
+    spans = []
+    for step, index in tasks:
+        with open(tmp_path / f'{step}{index}') as f:
+            spans.append([float(t) for t in f.read().split()])
+    overlap = max(sum(1 for start, end in spans if start <= t < end) for t, _ in spans)
+    assert overlap == 2
+
+def test_run_tasks_budget_fill(monkeypatch, tmp_path):
+    '''Smaller ready tasks use the capacity a larger one doesn't fit in.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'test')
+    chip.set('mode', 'sim')
+    chip.node('small', 'join', index=0)
+    chip.node('big', 'join')
+    for i in range(1, 3):
+        chip.node('small', 'join', index=i)
+    chip.set('maxthreads', 4)
+
+    def fake_runtask(chip, step, index, active, error):
+        start = time.time()
+        time.sleep(0.2)
+        with open(tmp_path / f'{step}{index}', 'w') as f:
+            f.write(f'{start} {time.time()}')
+        error[step + index] = 0
+
+    def fake_resources(chip, step, index):
+        # more than the budget
+        return (16, 0) if step == 'big' else (1, 0)
+
+    monkeypatch.setattr(siliconcompiler.Chip, '_runtask', fake_runtask)
+    monkeypatch.setattr(siliconcompiler.Chip, '_task_resources', fake_resources)
+
+    tasks = [('small', '0'), ('big', '0'), ('small', '1'), ('small', '2')]
+    active = {step + index: 1 for step, index in tasks}
+    error = {step + index: 1 for step, index in tasks}
+    chip._run_tasks(tasks, active, error)
+
+    assert not any(error.values())
+    spans = {}
+    for step, index in tasks:
+        with open(tmp_path / f'{step}{index}') as f:
+            spans[step + index] = [float(t) for t in f.read().split()]
+    # the small tasks run together, then the big one runs alone
+    big_start, big_end = spans.pop('big0')
+    assert all(end <= big_start for start, end in spans.values())
+    assert max(start for start, end in spans.values()) < min(end for start, end in spans.values())
+
+def test_run_incremental():
+    '''Tasks whose fingerprint is unchanged reuse the outputs of the last run.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'test')
+    chip.set('mode', 'sim')
+    chip.set('quiet', True)
+    chip.set('incremental', True)
+    chip.node('import', 'join')
+    for i in range(2):
+        chip.node('work', 'join', index=i)
+        chip.edge('import', 'work', head_index=i)
+        chip.edge('work', 'sel', tail_index=i)
+    chip.node('sel', 'minimum')
+    chip.node('export', 'join')
+    chip.edge('sel', 'export')
+    chip.set('arg', 'index', None)
+
+    def mark_all():
+        for step, index in (('import', '0'), ('work', '0'), ('work', '1'),
+                            ('sel', '0'), ('export', '0')):
+            workdir = chip._getworkdir(step=step, index=index)
+            assert os.path.isfile(os.path.join(workdir, 'sc_fingerprint'))
+            open(os.path.join(workdir, 'marker'), 'w').close()
+
+    def rerun():
+        return [step for step in ('import', 'work', 'sel', 'export') if not
+                os.path.isfile(os.path.join(chip._getworkdir(step=step), 'marker'))]
+
+    chip.run()
+    mark_all()
+    chip.run()
+    assert rerun() == []
+
+    # only the changed task and the ones after it run again
+    chip.set('flowgraph', 'sel', '0', 'weight', 'errors', 2.0)
+    chip.run()
+    assert rerun() == ['sel', 'export']
+    assert chip.get('flowstatus', 'sel', '0', 'select') == [('work', '0')]
+
+def test_run_cache(tmp_path):
+    '''Tasks found in the task cache are restored from it instead of running.'''
+
+    cachedir = str(tmp_path / 'cache')
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'test')
+    chip.set('mode', 'sim')
+    chip.set('quiet', True)
+    chip.set('loglevel', 'ERROR')
+    chip.set('cachedir', cachedir)
+    chip.node('import', 'join')
+    for i in range(2):
+        chip.node('work', 'join', index=i)
+        chip.edge('import', 'work', head_index=i)
+        chip.edge('work', 'sel', tail_index=i)
+    chip.node('sel', 'minimum')
+    chip.set('arg', 'index', None)
+
+    chip.set('jobname', 'job0')
+    chip.run()
+    assert len(os.listdir(cachedir)) > 0
+
+    # another job restores all tasks, hard linked from the cache, and
+    # keeps its own options
+    chip.set('jobname', 'job1')
+    chip.set('quiet', False)
+    chip.set('loglevel', 'INFO')
+    chip.run()
+    assert chip._reused == {('import', '0'), ('work', '0'), ('work', '1'), ('sel', '0')}
+    assert chip.get('jobname') == 'job1'
+    assert chip.get('quiet') is False
+    assert chip.get('loglevel') == 'INFO'
+    assert chip.logger.level == logging.INFO
+    assert chip.cfghistory['job1']['quiet']['value'] is False
+    for step in ('import', 'work', 'sel'):
+        manifest = chip._handoff_manifest(os.path.join(chip._getworkdir(step=step), 'outputs'))
+        assert os.stat(manifest).st_nlink == 2
+    assert chip.get('flowstatus', 'sel', '0', 'select') == [('work', '0')]
+
+    # results that don't fit are evicted
+    chip.set('cachesize', 0.0)
+    chip.set('flowgraph', 'sel', '0', 'weight', 'errors', 2.0)
+    chip.set('jobname', 'job2')
+    chip.run()
+    assert [os.listdir(os.path.join(cachedir, d)) for d in os.listdir(cachedir)] == \
+        [[] for d in os.listdir(cachedir)]
+
+def test_run_incremental_options():
+    '''Runtime options of a run that reuses all tasks are kept.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'test')
+    chip.set('mode', 'sim')
+    chip.set('incremental', True)
+    chip.node('import', 'join')
+    chip.node('export', 'join')
+    chip.edge('import', 'export')
+    chip.set('arg', 'index', None)
+
+    chip.set('quiet', True)
+    chip.set('loglevel', 'ERROR')
+    chip.run()
+
+    chip.set('quiet', False)
+    chip.set('loglevel', 'DEBUG')
+    chip.run()
+    assert chip._reused == {('import', '0'), ('export', '0')}
+    assert chip.get('quiet') is False
+    assert chip.get('loglevel') == 'DEBUG'
+    assert chip.logger.level == logging.DEBUG
+    assert chip.cfghistory['job0']['loglevel']['value'] == 'DEBUG'
+    assert chip.get('flowstatus', 'export', '0', 'error') == 0
+
+def test_run_incremental_task_values(monkeypatch):
+    '''Values that tasks set while running don't change the fingerprints of
+    the next run.'''
+
+    join = siliconcompiler.Chip.join
+    def floorplan_join(chip, *inputs):
+        if inputs:
+            # export step
+            chip.set('asic', 'diearea', [(0, 0), (100, 100)])
+        return join(chip, *inputs)
+    monkeypatch.setattr(siliconcompiler.Chip, 'join', floorplan_join)
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'test')
+    chip.set('mode', 'sim')
+    chip.set('quiet', True)
+    chip.set('incremental', True)
+    chip.node('import', 'join')
+    chip.node('export', 'join')
+    chip.edge('import', 'export')
+    chip.set('arg', 'index', None)
+
+    chip.run()
+    assert chip.get('asic', 'diearea') == [(0, 0), (100, 100)]
+    chip.run()
+    assert chip._reused == {('import', '0'), ('export', '0')}
+
+    # values the user sets still count
+    chip.set('asic', 'diearea', [(0, 0), (50, 50)])
+    chip.run()
+    assert chip._reused == set()
+    assert chip.get('asic', 'diearea') == [(0, 0), (100, 100)]
+    chip.run()
+    assert chip._reused == {('import', '0'), ('export', '0')}
+
+    # the schema template new chips start from is left alone
+    assert siliconcompiler.Chip().get('asic', 'diearea', field='example')
+
+def test_run_bases():
+    '''Runs share base manifests of equal content, and bases no task output
+    refers to are removed.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'test')
+    chip.set('mode', 'sim')
+    chip.set('quiet', True)
+    chip.set('incremental', True)
+    chip.node('import', 'join')
+    chip.node('export', 'join')
+    chip.edge('import', 'export')
+    chip.set('arg', 'index', None)
+
+    jobdir = chip._getworkdir()
+    def bases():
+        return sorted(f for f in os.listdir(jobdir)
+                      if f.startswith('test.base') and f.endswith(('.json', '.msgpack')))
+
+    chip.run()
+    first = bases()
+    assert len(first) == 1
+
+    # reused outputs still refer to the first base
+    chip.run()
+    assert chip._reused == {('import', '0'), ('export', '0')}
+    assert first[0] in bases()
+
+    # nothing refers to the old bases once all tasks ran again
+    chip.set('incremental', False)
+    chip.run()
+    assert len(bases()) == 1
+    assert bases() != first
+    assert not os.path.exists(os.path.join(jobdir, first[0] + '.digest'))
+
+    # an equal configuration reuses the base, without writing it again
+    basefile = chip._write_base(jobdir)
+    mtime = os.stat(basefile).st_mtime_ns
+    assert chip._write_base(jobdir) == basefile
+    assert os.stat(basefile).st_mtime_ns == mtime
+    assert not [f for f in os.listdir(jobdir) if f.startswith('.')]
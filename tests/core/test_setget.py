@@ -88,6 +88,18 @@ def test_set_add_field_list():
     chip.add('source', 'Ben Bitdiddle', field='author')
     assert chip.get('source', field='author') == ['Alyssa P. Hacker', 'Ben Bitdiddle']
 
+def test_get_default_no_expand():
+    '''Reading through a 'default' level must not create new keys, writing
+    must.'''
+    chip = siliconcompiler.Chip()
+    assert chip.get('eda', 'yosys', 'option', 'syn', '0') == []
+    assert 'yosys' not in chip.getkeys('eda')
+
+    chip.set('eda', 'yosys', 'option', 'syn', '0', '-v')
+    assert 'yosys' in chip.getkeys('eda')
+    assert chip.get('eda', 'yosys', 'option', 'syn', '0') == ['-v']
+    assert ['eda', 'yosys', 'option', 'syn', '0'] in chip.getkeys()
+
 #########################
 if __name__ == "__main__":
     test_setget()
@@ -0,0 +1,48 @@
+# Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+import siliconcompiler
+
+def test_setmany():
+    '''set_many()/get_many() must behave like one set()/get() per entry.'''
+
+    chip = siliconcompiler.Chip()
+    ref = siliconcompiler.Chip()
+
+    params = {
+        'exe': 'openroad',
+        'format': 'tcl',
+        ('option', 'place', '0'): '-no_init',
+        ('threads', 'place', '0'): 4,
+        ('threads', 'place', '1'): '8',
+        ('input', 'place', '0'): ['a.def', 'b.sdc']
+    }
+    chip.set_many('eda', 'openroad', params)
+    for keypath, value in params.items():
+        if isinstance(keypath, str):
+            keypath = (keypath,)
+        ref.set('eda', 'openroad', *keypath, value)
+
+    assert chip.getkeys() == ref.getkeys()
+    values = chip.get_many('eda', 'openroad', list(params))
+    for keypath, value in zip(params, values):
+        if isinstance(keypath, str):
+            keypath = (keypath,)
+        assert value == ref.get('eda', 'openroad', *keypath)
+    assert values[3:5] == [4, 8]
+
+    # clobber is honored per entry
+    chip.set_many('eda', 'openroad', {'exe': 'other', 'vswitch': '-version'}, clobber=False)
+    assert chip.get_many('eda', 'openroad', ['exe', 'vswitch']) == ['openroad', '-version']
+
+    # errors are reported like set()/get()
+    assert chip.error == 0
+    chip.set_many('eda', 'openroad', {('threads', 'place', '0'): 'many'})
+    assert chip.error == 1
+    assert chip.get('eda', 'openroad', 'threads', 'place', '0') == 4
+
+    chip.error = 0
+    chip.set_many('nonexistent', {'exe': 'x'})
+    assert chip.error == 1
+
+#########################
+if __name__ == "__main__":
+    test_setmany()
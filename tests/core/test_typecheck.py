@@ -48,6 +48,27 @@ def test_typecheck():
 
     assert (error == 0)
 
+def test_typedesc():
+    from siliconcompiler.schema import _typedesc
+
+    desc = _typedesc('[(str,str)]')
+    assert desc.is_list
+    assert desc.kind == 'tuple'
+    assert desc.arity == 2
+    assert desc.convert("('a', 'b')") == ('a', 'b')
+    assert _typedesc('[(str,str)]') is desc
+
+    desc = _typedesc('(float,float)')
+    assert not desc.is_list
+    assert desc.convert('(1.5, 2)') == (1.5, 2.0)
+
+    assert _typedesc('int').convert('3.0') == 3
+    assert _typedesc('bool').convert('true') is True
+    assert _typedesc('float').check('abc') is not None
+    assert _typedesc('float').check('1e3') is None
+    assert _typedesc('str').check(1) is not None
+
 #########################
 if __name__ == "__main__":
     test_typecheck()
+    test_typedesc()
@@ -1,5 +1,9 @@
 # Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
+import json
+
+import pytest
 import siliconcompiler
+from siliconcompiler import utils
 
 def test_write_manifest():
 
@@ -16,6 +20,187 @@ def test_write_manifest():
     chip.write_manifest('top.tcl')
     chip.write_manifest('top.yaml')
 
+def test_write_manifest_compact(monkeypatch):
+    '''Compact json manifests must hold the same data as indented ones,
+    whichever json library writes them.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'top')
+    chip.add('source', 'top.v')
+    chip.set('eda', 'yosys', 'threads', 'syn', '0', 4)
+    chip.set('flowgraph', 'syn', '0', 'weight', 'cellarea', 1.5)
+
+    chip.write_manifest('pretty.json')
+    with open('pretty.json') as f:
+        expected = json.load(f)
+
+    libs = {'orjson': utils.orjson, 'ujson': utils.ujson}
+    for lib in ('orjson', 'ujson', None):
+        if lib is not None and libs[lib] is None:
+            continue
+        for name, module in libs.items():
+            monkeypatch.setattr(utils, name, module if name == lib else None)
+
+        chip.write_manifest('compact.pkg.json', compact=True)
+        with open('compact.pkg.json') as f:
+            text = f.read()
+        assert '\n' not in text.strip()
+        assert json.loads(text) == expected
+        assert chip.read_manifest('compact.pkg.json', update=False) == \
+            chip.read_manifest('pretty.json', update=False)
+
+def test_write_manifest_keypaths():
+    '''Only the selected subtrees are written when keypaths are given.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'top')
+    chip.add('source', 'top.v')
+    chip.set('eda', 'magic', 'exe', 'magic')
+    chip.set('eda', 'netgen', 'exe', 'netgen')
+    chip.set('pdk', 'process', 'freepdk45')
+
+    chip.write_manifest('full.json')
+    chip.write_manifest('part.json', keypaths=[['design'], ['eda', 'magic'], ['pdk'],
+                                               ['pdk', 'process'], ['nonexistent']])
+    chip.write_manifest('part.tcl', keypaths=[['design'], ['eda', 'magic']])
+
+    with open('full.json') as f:
+        full = json.load(f)
+    with open('part.json') as f:
+        part = json.load(f)
+    assert part == {'design': full['design'],
+                    'eda': {'magic': full['eda']['magic']},
+                    'pdk': full['pdk']}
+
+    with open('part.tcl') as f:
+        lines = [line for line in f if line.startswith('dict set')]
+    assert lines
+    assert all(line.startswith(('dict set sc_cfg design ', 'dict set sc_cfg eda magic '))
+               for line in lines)
+
+    # the chip configuration is left alone
+    assert chip.getkeys('eda') == ['magic', 'netgen']
+
+def test_write_manifest_yaml(monkeypatch):
+    '''YAML manifests and FuseSoC cores written with libyaml must read back
+    like the pure Python ones, with sequences indented under their keys.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'top')
+    chip.add('source', 'top.v')
+    chip.add('source', 'a.v')
+    chip.add('constraint', 'top.sdc')
+    chip.set('asic', 'diearea', [(0, 0), (100.5, 200)])
+    chip.add('define', 'MSG=multi\nline: - x')
+
+    outputs = {}
+    for clib in sorted({False, utils.YAML_CLIB}):
+        monkeypatch.setattr(utils, 'YAML_CLIB', clib)
+        chip.write_manifest('top.yaml')
+        chip.write_manifest('top.core')
+        with open('top.yaml') as f:
+            manifest = utils.yaml_load(f)
+        with open('top.core') as f:
+            core = f.read()
+        outputs[clib] = (manifest, utils.yaml_load(core))
+
+        assert '    files:\n      - top.v\n      - a.v\n' in core
+        chip2 = siliconcompiler.Chip()
+        chip2.read_manifest('top.yaml')
+        assert chip2.get('source') == ['top.v', 'a.v']
+        assert chip2.get('asic', 'diearea') == [(0.0, 0.0), (100.5, 200.0)]
+        assert chip2.get('define') == ['MSG=multi\nline: - x']
+
+    if len(outputs) == 2:
+        assert outputs[True] == outputs[False]
+
+def test_write_manifest_digest(monkeypatch):
+    '''The digest identifies the manifest content, and unchanged manifests
+    aren't written again.'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'top')
+    chip.add('source', 'top.v')
+
+    digest = chip.digest_manifest()
+    chip2 = siliconcompiler.Chip()
+    chip2.set('design', 'top')
+    assert chip2.digest_manifest() != digest
+    chip2.add('source', 'top.v')
+    assert chip2.digest_manifest() == digest
+
+    chip.write_manifest('top.json')
+    def fail(*args, **kwargs):
+        raise AssertionError('manifest rewritten')
+    with monkeypatch.context() as m:
+        m.setattr(utils, 'json_dumps', fail)
+        chip.write_manifest('top.json')
+        # another set of options writes the file again
+        with pytest.raises(AssertionError):
+            chip.write_manifest('top.json', compact=True)
+        # so do changes to the chip
+        chip.add('source', 'a.v')
+        with pytest.raises(AssertionError):
+            chip.write_manifest('top.json')
+
+    # and to the file
+    chip.write_manifest('top.json')
+    assert chip.digest_manifest() != digest
+    with open('top.json', 'w') as f:
+        f.write('{}')
+    chip.write_manifest('top.json')
+    assert chip.read_manifest('top.json', update=False)['source']['value'] == ['top.v', 'a.v']
+
+    # other chips, as in another process, find the digest next to the file
+    chip3 = siliconcompiler.Chip()
+    chip3.set('design', 'top')
+    chip3.set('source', ['top.v', 'a.v'])
+    with monkeypatch.context() as m:
+        m.setattr(utils, 'json_dumps', fail)
+        chip3.write_manifest('top.json')
+        chip3.set('design', 'other')
+        with pytest.raises(AssertionError):
+            chip3.write_manifest('top.json')
+        # resolved paths depend on the files found, these are always written
+        with pytest.raises(AssertionError):
+            chip.write_manifest('top.json', abspath=True)
+
+@pytest.mark.skipif(utils.msgpack is None, reason='msgpack is not installed')
+def test_write_manifest_msgpack():
+    '''Ensure msgpack manifests read back like json ones, and are only type
+    checked when written for another schema version'''
+
+    chip = siliconcompiler.Chip()
+    chip.set('design', 'top')
+    chip.add('source', 'top.v')
+    chip.set('relax', True)
+    chip.set('clock', 'clk', 'period', 2.5)
+    chip.set('asic', 'diearea', [(0, 0), (100.5, 200)])
+    chip.write_manifest('top.pkg.json')
+    chip.write_manifest('top.pkg.msgpack')
+
+    chip2 = siliconcompiler.Chip()
+    chip2.read_manifest('top.pkg.json')
+    chip3 = siliconcompiler.Chip()
+    chip3.read_manifest('top.pkg.msgpack')
+    for keypath in chip2.getkeys():
+        assert chip3.get(*keypath) == chip2.get(*keypath)
+    assert chip3.get('asic', 'diearea') == [(0.0, 0.0), (100.5, 200.0)]
+
+    with open('top.pkg.msgpack', 'rb') as f:
+        cfg = utils.msgpack_load(f)
+    assert cfg['__schema__'] == chip.get('version', 'schema')
+    cfg['__schema__'] = '0.0.0'
+    cfg['design']['value'] = ['top', 'sub']
+    with open('old.pkg.msgpack', 'wb') as f:
+        f.write(utils.msgpack_dumps(cfg))
+
+    chip4 = siliconcompiler.Chip()
+    chip4.read_manifest('old.pkg.msgpack')
+    assert chip4.error == 1
+    assert chip4.get('design') is None
+
 #########################
 if __name__ == "__main__":
     test_write_manifest()
+    test_write_manifest_keypaths()
@@ -46,10 +46,11 @@ def test_doe(oh_dir):
 
     # Post-processing data
     chip = siliconcompiler.Chip()
+    chip.set('design', design)
     prev_area = 0
     for i in range(len(N)):
         jobname = 'job'+str(i)
-        chip.read_manifest(f"build/{design}/{jobname}/syn/0/outputs/{design}.pkg.json", job=jobname)
+        chip.read_manifest(chip.find_manifest(step='syn', jobname=jobname), job=jobname)
         area = chip.get('metric','syn','0','cellarea','real', job=jobname)
 
         # expect to have increasing area as we increase adder width